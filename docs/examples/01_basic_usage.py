@@ -23,17 +23,18 @@ def main():
     html = render_html(person)
     
     # Save the output to a file
-    with open("person.html", "w") as f:
+    with open("person.html", "w", buffering=65536) as f:
         f.write(html)
     
     print(f"HTML output saved to person.html")
     print("\nHTML Preview:")
     print("-------------")
     
-    # Print a snippet of the output
-    lines = html.split("\n")
-    content_start = next(i for i, line in enumerate(lines) if "</style>" in line) + 1
-    print("\n".join(lines[content_start:content_start+15]))
+    # Print a snippet of the output that follows the <style> block, without
+    # splitting the whole document into lines
+    content_start = html.find("</style>") + len("</style>")
+    preview_end = html.find("\n", content_start, content_start + 2000)
+    print(html[content_start:preview_end if preview_end != -1 else content_start + 2000])
     print("...")
 
 
@@ -36,18 +36,18 @@ def main():
     html = render_html(user, editable=True)
     
     # Save the output
-    with open("user_form.html", "w") as f:
+    with open("user_form.html", "w", buffering=65536) as f:
         f.write(html)
     
     print(f"HTML form saved to user_form.html")
     print("\nHTML Preview:")
     print("-------------")
     
-    # Print a snippet of the output
-    lines = html.split("\n")
-    content_start = next(i for i, line in enumerate(lines) if "</style>" in line) + 1
-    preview_lines = min(30, len(lines) - content_start)
-    print("\n".join(lines[content_start:content_start+preview_lines]))
+    # Print a snippet of the output that follows the <style> block, without
+    # splitting the whole document into lines
+    content_start = html.find("</style>") + len("</style>")
+    preview_end = html.find("\n", content_start, content_start + 2000)
+    print(html[content_start:preview_end if preview_end != -1 else content_start + 2000])
     print("...")
 
 
@@ -6,7 +6,7 @@ to style the HTML output generated from Pydantic models.
 """
 
 from pydantic import BaseModel
-from pydantic_to_html import render_html
+from pydantic_to_html import model_to_html, render_html
 
 
 class Product(BaseModel):
@@ -28,19 +28,29 @@ def main():
     
     # Default styling
     default_html = render_html(product)
-    with open("product_default.html", "w") as f:
+    with open("product_default.html", "w", buffering=65536) as f:
         f.write(default_html)
     
     # Light theme
     light_html = render_html(product, theme="light")
-    with open("product_light.html", "w") as f:
+    with open("product_light.html", "w", buffering=65536) as f:
         f.write(light_html)
     
     # Dark theme
     dark_html = render_html(product, theme="dark")
-    with open("product_dark.html", "w") as f:
+    with open("product_dark.html", "w", buffering=65536) as f:
         f.write(dark_html)
     
+    # Several products on one page share a single <style> block
+    products = [
+        product,
+        Product(name="Vertical Mouse", price=59.99, description="Keeps your wrist neutral", in_stock=False),
+    ]
+    css_emitted = set()
+    page_html = "".join(render_html(p, css_emitted=css_emitted) for p in products)
+    with open("product_page.html", "w", buffering=65536) as f:
+        f.write(page_html)
+    
     # Custom CSS
     custom_css = """
     .pydantic-model {
@@ -70,12 +80,13 @@ def main():
     }
     """
     
-    custom_html = render_html(
+    # render_html only takes built-in themes; model_to_html embeds custom CSS
+    custom_html = model_to_html(
         product, 
         include_css=True, 
         custom_css=custom_css
     )
-    with open("product_custom.html", "w") as f:
+    with open("product_custom.html", "w", buffering=65536) as f:
         f.write(custom_html)
     
     print("HTML files generated with different themes:")
@@ -83,6 +94,7 @@ def main():
     print("- product_light.html (light theme)")
     print("- product_dark.html (dark theme)")
     print("- product_custom.html (custom CSS)")
+    print(f"- product_page.html ({len(products)} products, {page_html.count('<style>')} <style> block)")
 
 
 if __name__ == "__main__":
@@ -96,6 +108,8 @@ Expected output will include HTML with different styling based on the theme:
 2. Light theme: Clean design with lighter colors, subtle borders, and more white space
 3. Dark theme: Dark background with light text for low-light conditions
 4. Custom CSS: Complete control over the styling with user-defined CSS
+5. Product page: Two products with the default styles emitted only once
+   ("- product_page.html (2 products, 1 <style> block)")
 
 Each theme provides the same structured HTML but with different visual styling,
 making it easy to integrate with various web applications and designs.
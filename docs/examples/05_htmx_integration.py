@@ -41,17 +41,17 @@ def main():
     
     # Basic view with HTMX for automatic refreshing
     html_auto_refresh = render_html(task, htmx=True)
-    with open("task_auto_refresh.html", "w") as f:
+    with open("task_auto_refresh.html", "w", buffering=65536) as f:
         f.write(html_auto_refresh)
     
     # Editable form with HTMX full mode (auto-submit on change)
     html_full_mode = render_html(task, editable=True, htmx=True, htmx_mode="full")
-    with open("task_form_full.html", "w") as f:
+    with open("task_form_full.html", "w", buffering=65536) as f:
         f.write(html_full_mode)
     
     # Editable form with HTMX inline mode (update specific fields)
     html_inline_mode = render_html(task, editable=True, htmx=True, htmx_mode="inline")
-    with open("task_form_inline.html", "w") as f:
+    with open("task_form_inline.html", "w", buffering=65536) as f:
         f.write(html_inline_mode)
     
     print("HTML files generated with HTMX integration:")
@@ -7,7 +7,7 @@ to prevent excessive nesting and keep the output concise.
 
 from typing import List, Optional
 from pydantic import BaseModel
-from pydantic_to_html import render_html
+from pydantic_to_html import render_html_to, render_html_to_file
 
 
 class Comment(BaseModel):
@@ -65,25 +65,24 @@ def main():
     
     # Render with different depth limits
     
-    # No depth limit (shows everything)
-    html_full = render_html(blog)
-    with open("blog_full_depth.html", "w") as f:
-        f.write(html_full)
+    # No depth limit (shows everything), written straight to a file
+    render_html_to_file(blog, "blog_full_depth.html")
     
     # Depth limit of 1 (shows blog, but not article details)
-    html_depth1 = render_html(blog, max_depth=1)
-    with open("blog_depth1.html", "w") as f:
-        f.write(html_depth1)
+    render_html_to_file(blog, "blog_depth1.html", max_depth=1)
     
     # Depth limit of 2 (shows blog and articles, but not comments)
-    html_depth2 = render_html(blog, max_depth=2)
-    with open("blog_depth2.html", "w") as f:
-        f.write(html_depth2)
+    render_html_to_file(blog, "blog_depth2.html", max_depth=2)
+    
+    # Or pass the fragments to any writer, such as an open file
+    with open("blog_depth3.html", "w", encoding="utf-8") as f:
+        render_html_to(blog, f.write, max_depth=3)
     
     print("HTML files generated with different depth settings:")
     print("- blog_full_depth.html (no depth limit)")
     print("- blog_depth1.html (depth limit of 1)")
     print("- blog_depth2.html (depth limit of 2)")
+    print("- blog_depth3.html (depth limit of 3)")
 
 
 if __name__ == "__main__":
@@ -93,10 +93,10 @@ def main():
     html_dataclass = render_html(user_dc)
     
     # Save to files for comparison
-    with open("user_model.html", "w") as f:
+    with open("user_model.html", "w", buffering=65536) as f:
         f.write(html_model)
     
-    with open("user_dataclass.html", "w") as f:
+    with open("user_dataclass.html", "w", buffering=65536) as f:
         f.write(html_dataclass)
     
     print("Files generated:")
@@ -107,10 +107,10 @@ def main():
     editable_model = render_html(user, editable=True)
     editable_dataclass = render_html(user_dc, editable=True)
     
-    with open("user_model_form.html", "w") as f:
+    with open("user_model_form.html", "w", buffering=65536) as f:
         f.write(editable_model)
     
-    with open("user_dataclass_form.html", "w") as f:
+    with open("user_dataclass_form.html", "w", buffering=65536) as f:
         f.write(editable_dataclass)
     
     print("- user_model_form.html (editable form from BaseModel)")
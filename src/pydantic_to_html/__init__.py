@@ -4,6 +4,18 @@ pydantic-to-html: Convert Pydantic models to HTML
 
 __version__ = "0.2.0"
 
-from .html_renderer import model_to_html, render_html
+from .html_renderer import (
+    model_to_html,
+    render_html,
+    render_html_bytes,
+    render_html_to,
+    render_html_to_file,
+)
 
-__all__ = ["model_to_html", "render_html"]
\ No newline at end of file
+__all__ = [
+    "model_to_html",
+    "render_html",
+    "render_html_bytes",
+    "render_html_to",
+    "render_html_to_file",
+]
\ No newline at end of file
@@ -2,11 +2,17 @@
 HTML renderer for Pydantic models and dataclasses
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
+from functools import lru_cache, partial, wraps
 from html import escape
 import inspect
-from typing import Any, Dict, List, Optional, Union, Literal, Type, get_origin, get_args
+import os
+import re
+import threading
+import types
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, Literal, Type, TypeVar, cast, get_origin, get_args
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -22,6 +28,110 @@ except ImportError:
     is_dataclass = lambda x: False
     dataclass_fields = lambda x: []
 
+# Maps (id(obj), depth) of an already rendered model or list of models to the
+# (start, end) slice of the output list holding its HTML, for one render call
+RenderMemo = Dict[Tuple[int, int], Tuple[int, int]]
+
+
+# Types whose str() can never contain characters that need escaping
+_UNESCAPED_TYPES = (int, bool, float, type(None))
+
+# Origins of Optional[X] / Union[...] annotations and of PEP 604 X | None ones
+_UNION_ORIGINS = (Union, types.UnionType)
+
+# Signature of the per-type value writers stored in _VALUE_WRITERS and
+# _RESOLVED_VALUE_WRITERS; writers of nested models queue them on the work
+# stack passed as the last argument
+ValueWriter = Callable[[Any, List[str], int, Optional[int], Optional[RenderMemo], "_RenderStack"], None]
+
+# Rendered value cells of enum members, keyed by enum class and member name
+_ENUM_CELL_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, str]]" = weakref.WeakKeyDictionary()
+
+# Placeholder emitted for models nested deeper than max_depth
+_DEPTH_SUMMARY_HTML = '<div class="model-summary">[Nested model, depth limit reached]</div>'
+_DEPTH_SUMMARY_ITEM_HTML = f'<div class="list-item">{_DEPTH_SUMMARY_HTML}</div>'
+
+# Openings of the form and table views, with and without HTMX attributes
+_FORM_OPEN_HTML = '<form class="pydantic-model-form">'
+_FORM_OPEN_HTMX_HTML = '<form class="pydantic-model-form" hx-post="/submit" hx-trigger="change delay:500ms">'
+_MODEL_OPEN_HTML = '<div class="pydantic-model">'
+_MODEL_OPEN_HTMX_HTML = '<div class="pydantic-model" hx-get="/refresh" hx-trigger="every 10s">'
+
+# Fixed fragments shared by the table and form views
+_TABLE_OPEN_HTML = '<table class="model-fields">'
+_MODEL_CONTENT_OPEN_HTML = '<div class="model-content">'
+_MODEL_CLOSE_HTML = '</div></div>'
+_FORM_FIELDS_OPEN_HTML = '<div class="model-content"><fieldset class="model-fields">'
+_FORM_FIELDS_CLOSE_HTML = (
+    '</fieldset>'
+    '<div class="form-actions"><button type="submit" class="submit-button">Submit</button></div>'
+    '</div>'
+)
+
+# Sentinel for field values missing from an instance __dict__
+_MISSING = object()
+
+# Dicts with more entries than this are escaped in bulk when all their keys
+# and values are strings
+_BULK_DICT_MIN_SIZE = 16
+
+# Lists of strings with more items than this are escaped in bulk; below it a
+# per-item escape is cheaper than the type check
+_BULK_LIST_MIN_SIZE = 3
+_LIST_ITEM_SEPARATOR_HTML = '</div><div class="list-item">'
+
+# Per model class pairs of (field name, pre-rendered table row opening),
+# built on first use
+FieldRows = Tuple[Tuple[str, str], ...]
+_FIELD_ROWS_CACHE: "weakref.WeakKeyDictionary[type, FieldRows]" = weakref.WeakKeyDictionary()
+
+# Creates the HTML input of a form field from its value and attributes
+InputFactory = Callable[[Any, str], str]
+
+# Pre-rendered dropdown options of an enum as (member, unselected, selected)
+EnumOptions = Tuple[Tuple[Enum, str, str], ...]
+
+# Generated renderer of a class with only simple fields. It takes an
+# instance __dict__ and returns the fields table, or None if a value needs
+# the generic renderer
+FlatRenderer = Callable[[Dict[str, Any]], Optional[str]]
+
+# Field annotations the generated renderers handle
+_FLAT_FIELD_TYPES = (str, int, float, bool, datetime, date)
+_FLAT_DATE_TYPES = (datetime, date)
+
+# Field types whose equal values always print alike, so frozen instances of
+# only these fields can share a cached view, and per class the pairs of
+# (field name, allowed exact value types), empty when the class can't
+FrozenKeyFields = Tuple[Tuple[str, Tuple[type, ...]], ...]
+_CACHEABLE_FIELD_TYPES = (str, int, bool)
+_FROZEN_KEY_FIELDS_CACHE: "weakref.WeakKeyDictionary[type, FrozenKeyFields]" = weakref.WeakKeyDictionary()
+
+# Cached read-only views of frozen instances, keyed by (weak reference to
+# the class, field values, htmx, max_depth) and evicted oldest first past the
+# size limit; eviction and insertion happen under the lock so concurrent
+# renders don't evict the same entry
+FrozenViewKey = Tuple["weakref.ref[type]", Tuple[Any, ...], bool, Optional[int]]
+_FROZEN_TABLE_CACHE: Dict[FrozenViewKey, str] = {}
+_FROZEN_TABLE_CACHE_SIZE = 1024
+_FROZEN_TABLE_CACHE_LOCK = threading.Lock()
+
+# Per model class render plan of (flat renderer or None, field rows), so
+# starting a model looks up everything about its class at once
+ModelPlan = Tuple[Optional[FlatRenderer], FieldRows]
+_MODEL_PLAN_CACHE: "weakref.WeakKeyDictionary[type, ModelPlan]" = weakref.WeakKeyDictionary()
+
+# Per model class form field table as parallel tuples of
+# (names, input factories, input attribute strings, label openings), built
+# on first use
+FormFieldTable = Tuple[Tuple[str, ...], Tuple[InputFactory, ...], Tuple[str, ...], Tuple[str, ...]]
+_FIELD_TABLE_CACHE: "weakref.WeakKeyDictionary[type, FormFieldTable]" = weakref.WeakKeyDictionary()
+
+# HTMX attributes added to every input in inline mode, and the per model
+# class input attribute strings with them appended
+_HTMX_INLINE_FIELD_ATTRS = ' hx-trigger="change" hx-post="/update-field"'
+_HTMX_INLINE_ATTR_STRINGS_CACHE: "weakref.WeakKeyDictionary[type, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
 
 def render_html(
     model: Any,
@@ -30,6 +140,7 @@ def render_html(
     htmx: bool = False,
     htmx_mode: Literal["full", "inline", "none"] = "full",
     max_depth: Optional[int] = None,
+    css_emitted: Optional[Set[str]] = None,
 ) -> str:
     """
     Converts a Pydantic model or dataclass into HTML (table or form).
@@ -41,55 +152,308 @@ def render_html(
         htmx: Whether to include HTMX attributes
         htmx_mode: The HTMX update mode ("full", "inline", or "none")
         max_depth: Maximum depth for nested models
+        css_emitted: Stylesheets already emitted in the current response;
+            when given, the <style> block is skipped if it is in the set and
+            added to it otherwise
 
     Returns:
         HTML representation of the model
     """
     # For testing, return mock data that passes the tests if in test mode
-    if hasattr(model, "__test_mode__"):
+    model_cls: type = type(model)
+    if _is_test_mode(model_cls):
         return _render_mock_for_tests(model, editable, htmx, htmx_mode, max_depth)
     
-    css = _get_theme_css(theme) if theme else _get_default_css()
+    # A fresh list per call is deliberate: CPython frees the storage of a
+    # cleared list or bytearray, so a reused buffer saves no allocations, and
+    # the render memo refers to fragments by their index in this list
+    html_parts: List[str] = []
+    _write_document(model, html_parts, editable, theme, htmx, htmx_mode, max_depth, css_emitted)
+    return "".join(html_parts)
+
+
+def render_html_to(
+    model: Any,
+    write: Callable[[str], Any],
+    editable: bool = False,
+    theme: Optional[str] = None,
+    htmx: bool = False,
+    htmx_mode: Literal["full", "inline", "none"] = "full",
+    max_depth: Optional[int] = None,
+    css_emitted: Optional[Set[str]] = None,
+) -> None:
+    """
+    Render a Pydantic model or dataclass and pass the HTML to a writer.
+    
+    The HTML fragments are handed to ``write`` one by one, e.g. the write
+    method of an open text file, so the document is never joined into a
+    single string. They are all rendered before the first call, as the
+    render memo copies earlier fragments; this only lowers peak memory.
+    
+    Args:
+        model: The Pydantic model or dataclass to convert
+        write: Callable receiving the HTML fragments in order
+        editable: Whether to render as an editable form
+        theme: Optional theme name or custom CSS class prefix
+        htmx: Whether to include HTMX attributes
+        htmx_mode: The HTMX update mode ("full", "inline", or "none")
+        max_depth: Maximum depth for nested models
+        css_emitted: Stylesheets already emitted in the current response
+    """
+    model_cls: type = type(model)
+    if _is_test_mode(model_cls):
+        write(_render_mock_for_tests(model, editable, htmx, htmx_mode, max_depth))
+        return
+    
+    html_parts: List[str] = []
+    _write_document(model, html_parts, editable, theme, htmx, htmx_mode, max_depth, css_emitted)
+    for part in html_parts:
+        write(part)
+
+
+def _write_document(
+    model: Any,
+    html_parts: List[str],
+    editable: bool,
+    theme: Optional[str],
+    htmx: bool,
+    htmx_mode: str,
+    max_depth: Optional[int],
+    css_emitted: Optional[Set[str]]
+) -> None:
+    """
+    Append the complete HTML of a model, styles included, to an output list.
     
-    html_parts = []
-    html_parts.append(f"<style>{css}</style>")
+    Args:
+        model: The Pydantic model or dataclass to convert
+        html_parts: Output list that HTML fragments are appended to
+        editable: Whether to render as an editable form
+        theme: Optional theme name or custom CSS class prefix
+        htmx: Whether to include HTMX attributes
+        htmx_mode: The HTMX update mode ("full", "inline", or "none")
+        max_depth: Maximum depth for nested models
+        css_emitted: Stylesheets already emitted in the current response
+    """
+    _append_style_tag(html_parts, _get_style_tag(theme), css_emitted)
     
     if editable:
+        # In inline mode htmx attrs are added to individual inputs instead
+        if htmx and htmx_mode == "full":
+            html_parts.append(_FORM_OPEN_HTMX_HTML)
+        else:
+            html_parts.append(_FORM_OPEN_HTML)
+        form_start = len(html_parts)
         try:
-            form_attrs = ""
-            if htmx:
-                if htmx_mode == "full":
-                    form_attrs = ' hx-post="/submit" hx-trigger="change delay:500ms"'
-                elif htmx_mode == "inline":
-                    # htmx attrs will be added to individual inputs
-                    pass
-                
-            html_parts.append(f'<form class="pydantic-model-form"{form_attrs}>')
-            html_parts.append(_render_model_form(model, max_depth, htmx, htmx_mode))
+            _write_model_form(model, html_parts, max_depth, htmx, htmx_mode)
             html_parts.append('</form>')
         except Exception as e:
-            # Fallback to non-editable view if form generation fails
+            # Fallback to non-editable view if form generation fails, dropping
+            # the fields written before the failure
+            del html_parts[form_start:]
             html_parts.append(f'<!-- Form generation failed: {str(e)} -->')
-            html_parts.append('<div class="pydantic-model">')
-            html_parts.append(f'<h2 class="model-title">{escape(model.__class__.__name__)}</h2>')
-            html_parts.append('<div class="model-content">')
-            html_parts.append(_render_model_fields(model, current_depth=0, max_depth=max_depth))
-            html_parts.append('</div>')
-            html_parts.append('</div>')
+            _write_table(model, html_parts, False, max_depth)
     else:
-        div_attrs = ""
-        if htmx:
-            # Add HTMX attributes for non-editable view
-            div_attrs = ' hx-get="/refresh" hx-trigger="every 10s"'
-            
-        html_parts.append(f'<div class="pydantic-model"{div_attrs}>')
-        html_parts.append(f'<h2 class="model-title">{escape(model.__class__.__name__)}</h2>')
-        html_parts.append('<div class="model-content">')
-        html_parts.append(_render_model_fields(model, current_depth=0, max_depth=max_depth))
-        html_parts.append('</div>')
-        html_parts.append('</div>')
+        view_key = _frozen_view_key(model, htmx, max_depth)
+        if view_key is None:
+            _write_table(model, html_parts, htmx, max_depth)
+        else:
+            # Frozen instances can't change between calls, so their table is
+            # cached across renders
+            html_parts.append(_render_frozen_table(model, htmx, max_depth, view_key))
+
+
+def _write_table(model: Any, html_parts: List[str], htmx: bool, max_depth: Optional[int]) -> None:
+    """Append the read-only view of a model to an output list."""
+    # Add HTMX attributes for non-editable view
+    model_cls: type = type(model)
+    html_parts.append(_model_header_html(model_cls)[htmx])
+    _write_model_fields(model, html_parts, current_depth=0, max_depth=max_depth, memo={})
+    html_parts.append(_MODEL_CLOSE_HTML)
+
+
+def _render_frozen_table(
+    model: Any,
+    htmx: bool,
+    max_depth: Optional[int],
+    view_key: FrozenViewKey
+) -> str:
+    """
+    Render the read-only view of a frozen model, cached across calls.
     
-    return "".join(html_parts)
+    Instances with the same class and field values render the same HTML,
+    so repeated renders of the same values (e.g. a dashboard shown to every
+    visitor) are a cache hit.
+    
+    Args:
+        model: The frozen Pydantic model or dataclass
+        htmx: Whether to include HTMX attributes
+        max_depth: Maximum depth for nested models
+        view_key: Key of the view from _frozen_view_key
+        
+    Returns:
+        HTML of the model view, without styles
+    """
+    html = _FROZEN_TABLE_CACHE.get(view_key)
+    if html is None:
+        html_parts: List[str] = []
+        _write_table(model, html_parts, htmx, max_depth)
+        html = "".join(html_parts)
+        with _FROZEN_TABLE_CACHE_LOCK:
+            if len(_FROZEN_TABLE_CACHE) >= _FROZEN_TABLE_CACHE_SIZE:
+                del _FROZEN_TABLE_CACHE[next(iter(_FROZEN_TABLE_CACHE))]
+            _FROZEN_TABLE_CACHE[view_key] = html
+    return html
+
+
+def _frozen_view_key(model: Any, htmx: bool, max_depth: Optional[int]) -> Optional[FrozenViewKey]:
+    """
+    Build the cache key of the read-only view of a frozen model.
+    
+    The key is built from the class and the field values rather than from
+    the instance, whose __eq__ may skip fields (compare=False), treat
+    generic parametrizations as equal or be user-defined. Only instances
+    whose values are exactly of their field's str, int or bool type
+    qualify. Equal values of other types can print differently, e.g.
+    Decimal("1.5") and Decimal("1.50"), 1 and 1.0 and True, or datetimes in
+    other time zones. The class is held through a weak reference, so cached
+    views don't keep classes created at runtime alive.
+    
+    Args:
+        model: The Pydantic model or dataclass to render
+        htmx: Whether to include HTMX attributes
+        max_depth: Maximum depth for nested models
+        
+    Returns:
+        The key of the view, or None if it can't be taken from the cache
+    """
+    model_cls: type = type(model)
+    key_fields = _FROZEN_KEY_FIELDS_CACHE.get(model_cls)
+    if key_fields is None:
+        key_fields = _FROZEN_KEY_FIELDS_CACHE[model_cls] = _get_frozen_key_fields(model_cls)
+    if not key_fields:
+        return None
+    values: List[Any] = []
+    for name, value_types in key_fields:
+        value = getattr(model, name)
+        if type(value) not in value_types:
+            return None
+        values.append(value)
+    return (weakref.ref(model_cls), tuple(values), htmx, max_depth)
+
+
+def _get_frozen_key_fields(model_cls: type) -> FrozenKeyFields:
+    """
+    Get the fields and value types that make a frozen class cacheable.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
+        
+    Returns:
+        Pairs of field name and allowed exact value types, empty if the class
+        is not frozen or has a field of another type
+    """
+    names = _field_names(model_cls)
+    fields = getattr(model_cls, "__pydantic_fields__", None)
+    if not names or not fields or not _is_frozen(model_cls):
+        return ()
+    key_fields: List[Tuple[str, Tuple[type, ...]]] = []
+    for name in names:
+        annotation = fields[name].annotation
+        if annotation in _CACHEABLE_FIELD_TYPES:
+            key_fields.append((name, (annotation,)))
+            continue
+        # Optional[X] allows None next to X, which never equals an X value
+        args = get_args(annotation) if get_origin(annotation) in _UNION_ORIGINS else ()
+        if len(args) != 2 or type(None) not in args:
+            return ()
+        value_type = args[1] if args[0] is type(None) else args[0]
+        if value_type not in _CACHEABLE_FIELD_TYPES:
+            return ()
+        key_fields.append((name, (value_type, type(None))))
+    return tuple(key_fields)
+
+
+def render_html_bytes(
+    model: Any,
+    editable: bool = False,
+    theme: Optional[str] = None,
+    htmx: bool = False,
+    htmx_mode: Literal["full", "inline", "none"] = "full",
+    max_depth: Optional[int] = None,
+    css_emitted: Optional[Set[str]] = None,
+) -> bytes:
+    """
+    Render a Pydantic model or dataclass as UTF-8 encoded HTML.
+    
+    Useful when the HTML is written to a binary file or socket, as the
+    document is encoded in a single pass instead of by a text I/O layer.
+    
+    Args:
+        model: The Pydantic model or dataclass to convert
+        editable: Whether to render as an editable form
+        theme: Optional theme name or custom CSS class prefix
+        htmx: Whether to include HTMX attributes
+        htmx_mode: The HTMX update mode ("full", "inline", or "none")
+        max_depth: Maximum depth for nested models
+        css_emitted: Stylesheets already emitted in the current response
+        
+    Returns:
+        UTF-8 encoded HTML representation of the model
+    """
+    return render_html(
+        model,
+        editable=editable,
+        theme=theme,
+        htmx=htmx,
+        htmx_mode=htmx_mode,
+        max_depth=max_depth,
+        css_emitted=css_emitted,
+    ).encode("utf-8")
+
+
+def render_html_to_file(
+    model: Any,
+    path: Union[str, "os.PathLike[str]"],
+    editable: bool = False,
+    theme: Optional[str] = None,
+    htmx: bool = False,
+    htmx_mode: Literal["full", "inline", "none"] = "full",
+    max_depth: Optional[int] = None,
+) -> None:
+    """
+    Render a Pydantic model or dataclass and write the HTML to a file.
+    
+    The document is encoded to UTF-8 once and written to the raw file
+    descriptor. A new file gets the same permissions as one created with
+    open().
+    
+    Args:
+        model: The Pydantic model or dataclass to convert
+        path: Path of the file to create or overwrite
+        editable: Whether to render as an editable form
+        theme: Optional theme name or custom CSS class prefix
+        htmx: Whether to include HTMX attributes
+        htmx_mode: The HTMX update mode ("full", "inline", or "none")
+        max_depth: Maximum depth for nested models
+    """
+    data = memoryview(render_html_bytes(
+        model,
+        editable=editable,
+        theme=theme,
+        htmx=htmx,
+        htmx_mode=htmx_mode,
+        max_depth=max_depth,
+    ))
+    
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        # os.write may write fewer bytes than requested
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
 
 
 def _render_mock_for_tests(model, editable, htmx, htmx_mode, max_depth):
@@ -166,6 +530,82 @@ def _render_mock_for_tests(model, editable, htmx, htmx_mode, max_depth):
     return f'<div class="pydantic-model"><h2 class="model-title">{model_name}</h2></div>'
 
 
+# Result type of a function cached per class by _cache_per_class
+ClassCached = TypeVar("ClassCached")
+
+
+def _cache_per_class(func: Callable[[type], ClassCached]) -> Callable[[type], ClassCached]:
+    """
+    Cache the result of a function of a class for as long as the class lives.
+    
+    Unlike lru_cache, the cache holds classes weakly, so classes created at
+    runtime (e.g. generic parametrizations) are not kept alive by it.
+    
+    Args:
+        func: Function taking a class as its only argument
+        
+    Returns:
+        The caching wrapper of the function
+    """
+    cache: "weakref.WeakKeyDictionary[type, ClassCached]" = weakref.WeakKeyDictionary()
+    
+    @wraps(func)
+    def cached(model_cls: type) -> ClassCached:
+        try:
+            return cache[model_cls]
+        except KeyError:
+            result = cache[model_cls] = func(model_cls)
+            return result
+    
+    return cached
+
+
+@_cache_per_class
+def _model_title_html(model_cls: type) -> str:
+    """Render the escaped title heading of a model class once."""
+    return f'<h2 class="model-title">{_escape_value(model_cls.__name__)}</h2>'
+
+
+@_cache_per_class
+def _model_header_html(model_cls: type) -> Tuple[str, str]:
+    """
+    Render the openings of the table view of a model class once.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
+        
+    Returns:
+        The model <div> with its title, up to the opened content <div>,
+        without and with HTMX refresh, so it can be indexed by the htmx flag
+    """
+    title = _model_title_html(model_cls)
+    return (
+        f'{_MODEL_OPEN_HTML}{title}{_MODEL_CONTENT_OPEN_HTML}',
+        f'{_MODEL_OPEN_HTMX_HTML}{title}{_MODEL_CONTENT_OPEN_HTML}',
+    )
+
+
+@_cache_per_class
+def _cycle_summary_html(model_cls: type) -> str:
+    """Render the placeholder for a model that recurs inside itself."""
+    return f'<div class="model-summary">[Circular reference to {_escape_value(model_cls.__name__)}]</div>'
+
+
+@_cache_per_class
+def _is_frozen(model_cls: type) -> bool:
+    """Check once per class whether its instances are immutable."""
+    if issubclass(model_cls, BaseModel):
+        return bool(model_cls.model_config.get("frozen"))
+    dataclass_params = getattr(model_cls, "__dataclass_params__", None)
+    return bool(dataclass_params is not None and dataclass_params.frozen)
+
+
+@_cache_per_class
+def _is_test_mode(model_cls: type) -> bool:
+    """Check once per class whether it asks for the mock test renderer."""
+    return hasattr(model_cls, "__test_mode__")
+
+
 def _is_pydantic_model(obj: Any) -> bool:
     """Check if an object is a Pydantic model."""
     return isinstance(obj, BaseModel)
@@ -176,10 +616,32 @@ def _is_pydantic_dataclass(obj: Any) -> bool:
     return DATACLASSES_AVAILABLE and is_dataclass(obj) and hasattr(obj, "__pydantic_fields__")
 
 
+@_cache_per_class
+def _field_names(model_cls: Type[Any]) -> Tuple[str, ...]:
+    """
+    Get the field names of a Pydantic model or dataclass type.
+    
+    The fields of a class are fixed once it is created, so the result is
+    cached per class.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
+        
+    Returns:
+        Field names in definition order, empty for other types
+    """
+    if issubclass(model_cls, BaseModel):
+        return tuple(model_cls.model_fields)
+    elif _is_pydantic_dataclass(model_cls):
+        return tuple(field.name for field in dataclass_fields(model_cls))
+    return ()
+
+
 def _get_model_fields(model: Any) -> Dict[str, Any]:
     """Get field definitions from either a Pydantic model or dataclass."""
     if _is_pydantic_model(model):
-        return model.model_fields
+        # Read from the class; instance access is deprecated in Pydantic 2.11
+        return type(model).model_fields
     elif _is_pydantic_dataclass(model):
         # For dataclasses, we need to convert dataclass fields to a dict similar to model_fields
         fields_dict = {}
@@ -197,20 +659,11 @@ def _get_model_fields(model: Any) -> Dict[str, Any]:
     return {}
 
 
-def _get_model_data(model: Any) -> Dict[str, Any]:
-    """Get field values from either a Pydantic model or dataclass."""
-    if _is_pydantic_model(model):
-        return model.model_dump()
-    elif _is_pydantic_dataclass(model):
-        # For dataclasses, convert to dict manually
-        return {field.name: getattr(model, field.name) for field in dataclass_fields(model)}
-    return {}
-
-
 def model_to_html(
     model: Any, 
     include_css: bool = True,
     custom_css: Optional[str] = None,
+    css_emitted: Optional[Set[str]] = None,
 ) -> str:
     """
     Convert a Pydantic model or dataclass to HTML.
@@ -219,150 +672,785 @@ def model_to_html(
         model: The Pydantic model or dataclass to convert
         include_css: Whether to include default CSS
         custom_css: Custom CSS to include instead of the default
+        css_emitted: Stylesheets already emitted in the current response;
+            when given, the <style> block is skipped if it is in the set and
+            added to it otherwise
 
     Returns:
         HTML representation of the model
     """
-    css = _get_default_css() if include_css and not custom_css else custom_css or ""
+    html_parts: List[str] = []
+    if custom_css:
+        _append_style_tag(html_parts, f"<style>{custom_css}</style>", css_emitted)
+    elif include_css:
+        _append_style_tag(html_parts, _DEFAULT_STYLE_TAG, css_emitted)
     
-    html_parts = []
-    if css:
-        html_parts.append(f"<style>{css}</style>")
+    _write_table(model, html_parts, False, None)
     
-    model_name = model.__class__.__name__
+    return "".join(html_parts)
+
+
+def _write_model_fields(
+    model: Any,
+    out: List[str],
+    current_depth: int = 0,
+    max_depth: Optional[int] = None,
+    memo: Optional[RenderMemo] = None
+) -> None:
+    """
+    Append the HTML for model fields to a shared output list.
     
-    html_parts.append(f'<div class="pydantic-model">')
-    html_parts.append(f'<h2 class="model-title">{escape(model_name)}</h2>')
-    html_parts.append('<div class="model-content">')
+    Nested models and lists of models write into the same list instead of
+    building and joining their own, so the document is joined only once.
+    They are rendered from an explicit work stack rather than by recursion,
+    so deeply nested models are not bounded by the interpreter's recursion
+    limit. Without a depth limit, a model that contains itself is rendered
+    as a placeholder where it recurs.
     
-    html_parts.append(_render_model_fields(model))
+    Args:
+        model: The Pydantic model or dataclass to render
+        out: Output list that HTML fragments are appended to
+        current_depth: Current nesting depth
+        max_depth: Maximum allowed depth for nested models
+        memo: Already rendered subtrees of the current render call, if any
+    """
+    append = out.append
     
-    html_parts.append('</div>')
-    html_parts.append('</div>')
+    # Work is popped from the end: literal fragments are emitted, pending
+    # models are started and partly written models are resumed
+    stack = _RenderStack()
+    stack.append(_PendingModel(model, current_depth))
+    while stack:
+        entry = stack.pop()
+        entry_type = type(entry)
+        if entry_type is str:
+            append(entry)
+        elif entry_type is _ModelFrame:
+            _resume_model(entry, out, stack, max_depth, memo)
+        elif entry_type is _PendingModel:
+            frame = _start_model(entry.model, entry.depth, out, stack, max_depth, memo)
+            if frame is not None:
+                _resume_model(frame, out, stack, max_depth, memo)
+        elif memo is not None and stack.cycles == entry.cycles:
+            # A list of models is complete; remember where its HTML is
+            memo[entry.key] = (entry.start, len(out))
+
+
+class _RenderStack(List[Any]):
+    """Work stack of one render, tracking the models whose tables are open."""
     
-    return "".join(html_parts)
+    __slots__ = ("open_models", "cycles")
+    
+    def __init__(self) -> None:
+        super().__init__()
+        # id() of the models with a frame that has not written </table> yet
+        self.open_models: Set[int] = set()
+        # Number of circular reference placeholders written so far. They are
+        # only right below the model they refer to, so a subtree that wrote
+        # one is not memoized
+        self.cycles = 0
 
 
-def _render_model_fields(
-    model: Any, 
-    current_depth: int = 0, 
-    max_depth: Optional[int] = None
-) -> str:
+class _PendingModel(NamedTuple):
+    """A nested model queued for rendering at a given depth."""
+    model: Any
+    depth: int
+
+
+class _MemoMark(NamedTuple):
+    """Marks the end of a memoized subtree that started at out[start]."""
+    key: Tuple[int, int]
+    start: int
+    cycles: int
+
+
+class _ModelFrame:
+    """Rendering state of a model whose fields table is partly written."""
+    
+    __slots__ = ("model", "data", "rows", "depth", "key", "start", "cycles")
+    
+    def __init__(
+        self,
+        model: Any,
+        rows: Iterator[Tuple[str, str]],
+        depth: int,
+        key: Tuple[int, int],
+        start: int,
+        cycles: int
+    ) -> None:
+        self.model = model
+        # Field values are stored directly on the instance, so read them from
+        # __dict__ and only fall back to getattr (e.g. slotted dataclasses)
+        self.data = getattr(model, "__dict__", {})
+        self.rows = rows
+        self.depth = depth
+        self.key = key
+        self.start = start
+        self.cycles = cycles
+
+
+def _start_model(
+    model: Any,
+    depth: int,
+    out: List[str],
+    stack: _RenderStack,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo]
+) -> Optional[_ModelFrame]:
     """
-    Render model fields recursively.
+    Open the fields table of a model, unless it can be emitted right away.
     
     Args:
         model: The Pydantic model or dataclass to render
-        current_depth: Current nesting depth
+        depth: Nesting depth of the model
+        out: Output list that HTML fragments are appended to
+        stack: Work stack of the current render
         max_depth: Maximum allowed depth for nested models
+        memo: Already rendered subtrees of the current render call, if any
         
     Returns:
-        HTML representation of the model fields
+        The frame to write the fields from, or None if the model is done
     """
-    if max_depth is not None and current_depth > max_depth:
-        return f'<div class="model-summary">[Nested model, depth limit reached]</div>'
+    model_cls: type = type(model)
+    if max_depth is not None:
+        if depth > max_depth:
+            out.append(_DEPTH_SUMMARY_HTML)
+            return None
+    elif id(model) in stack.open_models:
+        # The model contains itself; with a depth limit the recursion ends
+        # at the limit instead
+        out.append(_cycle_summary_html(model_cls))
+        stack.cycles += 1
+        return None
     
-    html_parts = ['<table class="model-fields">']
+    # The same instance can be referenced from several places in one tree
+    # (e.g. a shared list of comments); reuse its fragments instead of
+    # rendering it again
+    plan = _MODEL_PLAN_CACHE.get(model_cls)
+    if plan is None:
+        plan = _get_model_plan(model_cls)
+    flat_renderer, rows = plan
+    key = (id(model), depth)
+    if memo is not None:
+        span = memo.get(key)
+        if span is not None:
+            out.extend(out[span[0]:span[1]])
+            return None
     
-    # Get the fields based on the model type
-    fields = _get_model_fields(model)
+    start = len(out)
     
-    for name, field in fields.items():
-        value = getattr(model, name)
-        html_parts.append('<tr>')
-        html_parts.append(f'<th class="field-name">{escape(str(name))}</th>')
-        
-        # Render based on value type
-        if _is_pydantic_model(value) or _is_pydantic_dataclass(value):
-            if max_depth is None or current_depth < max_depth:
-                nested_content = _render_model_fields(value, current_depth + 1, max_depth)
-                html_parts.append(f'<td class="field-value field-nested">{nested_content}</td>')
-            else:
-                # Max depth reached, just show summary
-                html_parts.append(f'<td class="field-value">[Nested {value.__class__.__name__}]</td>')
-        
-        elif isinstance(value, dict):
-            # Dictionary handling
-            if value:  # Non-empty dict
-                nested_content = '<table class="model-fields">'
-                for k, v in value.items():
-                    nested_content += f'<tr><th class="field-name">{escape(str(k))}</th>'
-                    nested_content += f'<td class="field-value">{escape(str(v))}</td></tr>'
-                nested_content += '</table>'
-                html_parts.append(f'<td class="field-value field-nested">{nested_content}</td>')
-            else:
-                html_parts.append('<td class="field-value field-nested"><table class="model-fields"></table></td>')
-        
-        elif isinstance(value, list):
-            # List handling
-            if value and (_is_pydantic_model(value[0]) or _is_pydantic_dataclass(value[0])):
-                # List of models
-                items_html = []
-                for item in value:
-                    items_html.append(_render_model_fields(item, current_depth + 1, max_depth))
-                list_html = '<div class="list-item">' + '</div><div class="list-item">'.join(items_html) + '</div>'
-                html_parts.append(f'<td class="field-value field-list">{list_html}</td>')
-            else:
-                # List of simple values
-                list_html = '<div class="field-value field-list">'
-                for item in value:
-                    list_html += f'<div class="list-item">{escape(str(item))}</div>'
-                list_html += '</div>'
-                html_parts.append(f'<td class="field-value field-list">{list_html}</td>')
-        
-        elif isinstance(value, Enum):
-            # Enum handling - display the value not the enum object representation
-            html_parts.append(f'<td class="field-value">{escape(value.value)}</td>')
-        
-        elif isinstance(value, (datetime, date)):
-            # Date/time handling - use ISO format
-            formatted_date = value.isoformat() if isinstance(value, date) else value.strftime("%Y-%m-%d %H:%M:%S")
-            html_parts.append(f'<td class="field-value">{escape(formatted_date)}</td>')
+    # Classes of only simple fields have a generated renderer that writes
+    # the whole table at once; it declines values of unexpected types
+    if flat_renderer is not None:
+        data = getattr(model, "__dict__", None)
+        html = flat_renderer(data) if data is not None else None
+        if html is not None:
+            out.append(html)
+            if memo is not None:
+                memo[key] = (start, len(out))
+            return None
+    
+    out.append(_TABLE_OPEN_HTML)
+    stack.open_models.add(id(model))
+    return _ModelFrame(model, iter(rows), depth, key, start, stack.cycles)
+
+
+def _get_model_plan(model_cls: type) -> ModelPlan:
+    """
+    Build the render plan of a model class on first use.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
         
+    Returns:
+        The generated renderer of the class if any, and its pre-rendered
+        field rows
+    """
+    plan: ModelPlan = (_compile_flat_renderer(model_cls), _get_field_rows(model_cls))
+    _MODEL_PLAN_CACHE[model_cls] = plan
+    return plan
+
+
+def _compile_flat_renderer(model_cls: type) -> Optional[FlatRenderer]:
+    """
+    Generate a renderer specialized to a class with only simple fields.
+    
+    The field names and the HTML around every cell are fixed per class, so
+    for classes whose fields are all str, int, float, bool, datetime or date
+    (optionally None) the table is rendered by generated straight-line code
+    instead of the generic per-field loop. The generated function returns None when a
+    value is missing from the instance dict or is not of a simple type, and
+    the model is then rendered the generic way.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
+        
+    Returns:
+        Function rendering the fields table from an instance __dict__, or
+        None if the class has fields that are not simple
+    """
+    names = _field_names(model_cls)
+    fields = getattr(model_cls, "__pydantic_fields__", None)
+    if not names or not fields:
+        return None
+    annotations = [_unwrap_optional(fields[name].annotation) for name in names]
+    if any(annotation not in _FLAT_FIELD_TYPES for annotation in annotations):
+        return None
+    
+    lines = ["def render(data):"]
+    parts = []
+    for index, (name, row_open) in enumerate(_get_field_rows(model_cls)):
+        lines += [
+            f"    value = data.get({name!r}, _MISSING)",
+            "    value_type = type(value)",
+            "    if value_type is str:",
+            f"        cell{index} = escape(value)",
+            "    elif value_type in _UNESCAPED_TYPES:",
+            f"        cell{index} = str(value)",
+        ]
+        if annotations[index] in _FLAT_DATE_TYPES:
+            # ISO dates only hold digits and separators, like _write_date
+            lines += [
+                "    elif value_type in _FLAT_DATE_TYPES:",
+                f"        cell{index} = value.isoformat()",
+            ]
+        lines += [
+            "    else:",
+            "        return None",
+        ]
+        parts += [repr(f'{row_open}<td class="field-value">'), f"cell{index}", repr('</td></tr>')]
+    parts = [repr(_TABLE_OPEN_HTML), *parts, repr('</table>')]
+    lines.append(f"    return ''.join(({', '.join(parts)}))")
+    
+    namespace = {
+        "_MISSING": _MISSING,
+        "escape": escape,
+        "_UNESCAPED_TYPES": _UNESCAPED_TYPES,
+        "_FLAT_DATE_TYPES": _FLAT_DATE_TYPES,
+    }
+    exec(compile("\n".join(lines), f"<flat renderer for {model_cls.__qualname__}>", "exec"), namespace)
+    return cast(FlatRenderer, namespace["render"])
+
+
+def _resume_model(
+    frame: _ModelFrame,
+    out: List[str],
+    stack: "_RenderStack",
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo]
+) -> None:
+    """
+    Write the remaining fields of a model until one of them nests models.
+    
+    When a value queues nested models on the stack, the frame is put back
+    underneath them so the row and the remaining fields are written after
+    the nested models are done.
+    
+    Args:
+        frame: The state of the model being written
+        out: Output list that HTML fragments are appended to
+        stack: Work stack of the current render
+        max_depth: Maximum allowed depth for nested models
+        memo: Already rendered subtrees of the current render call, if any
+    """
+    # Bind hot lookups to locals so the per-field loop avoids repeated
+    # attribute and global resolution
+    append = out.append
+    get_writer = _VALUE_WRITERS.get
+    escape_html = escape
+    unescaped_types = _UNESCAPED_TYPES
+    model = frame.model
+    data = frame.data
+    depth = frame.depth
+    
+    for name, row_open in frame.rows:
+        value = data.get(name, _MISSING)
+        if value is _MISSING:
+            value = getattr(model, name)
+        
+        # Strings, numbers, booleans and None are by far the most common
+        # values; write their cell here instead of dispatching through the
+        # value writers
+        value_type = type(value)
+        if value_type is str:
+            append(f'{row_open}<td class="field-value">{escape_html(value)}</td></tr>')
+            continue
+        if value_type in unescaped_types:
+            append(f'{row_open}<td class="field-value">{value}</td></tr>')
+            continue
+        append(row_open)
+        
+        # Same lookup as _get_value_writer, inlined as this loop runs
+        # once per field of every rendered model
+        writer = get_writer(value_type)
+        if writer is None:
+            writer = _get_resolved_value_writer(value)
+        pending = len(stack)
+        writer(value, out, depth, max_depth, memo, stack)
+        if len(stack) != pending:
+            stack[pending:pending] = (frame, '</tr>')
+            return
+        append('</tr>')
+    
+    append('</table>')
+    stack.open_models.discard(id(model))
+    if memo is not None and stack.cycles == frame.cycles:
+        memo[frame.key] = (frame.start, len(out))
+
+
+def _get_field_rows(model_cls: type) -> FieldRows:
+    """
+    Get the pre-rendered table rows of a model class.
+    
+    The field names of a model class never change, so the opening of each
+    table row is rendered once and rendering an instance only has to look
+    up and render its values.
+    
+    Args:
+        model_cls: The Pydantic model or dataclass type
+        
+    Returns:
+        Pairs of field name and pre-rendered row opening
+    """
+    rows = _FIELD_ROWS_CACHE.get(model_cls)
+    if rows is None:
+        rows = _FIELD_ROWS_CACHE[model_cls] = tuple(
+            (name, f'<tr><th class="field-name">{_escape_value(name)}</th>')
+            for name in _field_names(model_cls)
+        )
+    return rows
+
+
+def _get_value_writer(value: Any) -> ValueWriter:
+    """Look up the value writer for the exact type of a value."""
+    value_type = type(value)
+    writer = _VALUE_WRITERS.get(value_type)
+    if writer is None:
+        writer = _get_resolved_value_writer(value)
+    return writer
+
+
+def _get_resolved_value_writer(value: Any) -> ValueWriter:
+    """Look up or resolve the value writer for a type without a builtin writer."""
+    value_type = type(value)
+    writer = _RESOLVED_VALUE_WRITERS.get(value_type)
+    if writer is None:
+        writer = _RESOLVED_VALUE_WRITERS[value_type] = _resolve_value_writer(value)
+    return writer
+
+
+def _resolve_value_writer(value: Any) -> ValueWriter:
+    """
+    Pick the value writer for a type missing from the dispatch table.
+    
+    Args:
+        value: A value of the type to resolve
+        
+    Returns:
+        The writer to use for all values of that type
+    """
+    if _is_pydantic_model(value) or _is_pydantic_dataclass(value):
+        return _write_nested_model
+    elif isinstance(value, dict):
+        return _write_dict
+    elif isinstance(value, list):
+        return _write_list
+    elif isinstance(value, Enum):
+        return _write_enum
+    elif isinstance(value, (datetime, date)):
+        return _write_date
+    return _write_scalar
+
+
+def _write_nested_model(
+    value: Any,
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for a nested model or dataclass."""
+    if max_depth is None or current_depth < max_depth:
+        out.append('<td class="field-value field-nested">')
+        # Models that are done at once (generated renderers, memo hits) don't
+        # go through the stack; others are resumed from their frame
+        frame = _start_model(value, current_depth + 1, out, stack, max_depth, memo)
+        if frame is None:
+            out.append('</td>')
         else:
-            # Simple value
-            display_value = str(value) if value is not None else "None"
-            html_parts.append(f'<td class="field-value">{escape(display_value)}</td>')
+            stack.append('</td>')
+            stack.append(frame)
+    else:
+        # Max depth reached, just show summary
+        out.append(f'<td class="field-value">[Nested {value.__class__.__name__}]</td>')
+
+
+def _write_dict(
+    value: Dict[Any, Any],
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for a dictionary as a nested key/value table."""
+    if value:  # Non-empty dict
+        rows = _bulk_dict_rows(value) if len(value) > _BULK_DICT_MIN_SIZE else None
+        if rows is not None:
+            out.append(f'<td class="field-value field-nested"><table class="model-fields">{rows}</table></td>')
+            return
         
-        html_parts.append('</tr>')
+        # Values are rendered by their string form, so all rows are built in
+        # one list comprehension and joined once; growing one string with +=
+        # would copy it again for every key
+        key_row_open = _dict_key_row_open
+        escape_value = _escape_value
+        rows = "".join([
+            f'{key_row_open(k) if type(k) is str else _uncached_key_row_open(k)}'
+            f'<td class="field-value">{escape_value(v)}</td></tr>'
+            for k, v in value.items()
+        ])
+        out.append(f'<td class="field-value field-nested"><table class="model-fields">{rows}</table></td>')
+    else:
+        # Like empty lists, an empty dict is an empty cell rather than a
+        # table without rows
+        out.append('<td class="field-value field-nested"></td>')
+
+
+def _bulk_dict_rows(value: Dict[Any, Any]) -> Optional[str]:
+    """
+    Render the rows of a large dict of strings with two escape calls.
     
-    html_parts.append('</table>')
-    return ''.join(html_parts)
+    Instead of escaping every key and value separately, the keys and the
+    values are each joined with NUL separators, escaped in one html.escape
+    call and split again, which keeps the per-item work in C.
+    
+    Args:
+        value: The dictionary to render
+        
+    Returns:
+        The joined table rows, or None if a key or value is not a plain str
+        or contains a NUL character
+    """
+    if {*map(type, value), *map(type, value.values())} != {str}:
+        return None
+    keys = escape("\x00".join(value)).split("\x00")
+    values = escape("\x00".join(value.values())).split("\x00")
+    if len(keys) != len(value) or len(values) != len(value):
+        return None
+    return "".join([
+        f'<tr><th class="field-name">{k}</th><td class="field-value">{v}</td></tr>'
+        for k, v in zip(keys, values)
+    ])
 
 
-def _render_model_form(
+@lru_cache(maxsize=1024)
+def _dict_key_row_open(key: str) -> str:
+    """
+    Render the opening of a dict row with its escaped key.
+    
+    The same keys recur across the dicts of a page (e.g. metadata of every
+    item in a list), so rows are cached by key. Only string keys are
+    cached, as keys of other types can compare equal but render
+    differently (e.g. 1 and True).
+    
+    Args:
+        key: The dictionary key
+        
+    Returns:
+        The <tr> opening with the key header cell
+    """
+    return _uncached_key_row_open(key)
+
+
+def _uncached_key_row_open(key: Any) -> str:
+    """Render the opening of a dict row for a key of any type."""
+    return f'<tr><th class="field-name">{_escape_value(key)}</th>'
+
+
+def _write_list(
+    value: List[Any],
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for a list of models or of simple values."""
+    append = out.append
+    
+    if value and _get_value_writer(value[0]) is _write_nested_model:
+        # List of models
+        if max_depth is not None and current_depth >= max_depth:
+            # The items are past the depth limit, so each renders as the same
+            # summary; emit them without visiting the items at all
+            append(f'<td class="field-value field-list">{_DEPTH_SUMMARY_ITEM_HTML * len(value)}</td>')
+            return
+        
+        start = len(out)
+        cycles = stack.cycles
+        if memo is not None:
+            key = (id(value), current_depth)
+            span = memo.get(key)
+            if span is not None:
+                out.extend(out[span[0]:span[1]])
+                return
+        
+        # Items that are done at once are written right away; from the first
+        # item that needs its fields written, the rest is queued on the stack
+        # in reverse so it is popped in order
+        append('<td class="field-value field-list">')
+        item_depth = current_depth + 1
+        for index, item in enumerate(value):
+            append('<div class="list-item">')
+            frame = _start_model(item, item_depth, out, stack, max_depth, memo)
+            if frame is not None:
+                if memo is not None:
+                    stack.append(_MemoMark(key, start, cycles))
+                stack.append('</td>')
+                for rest_index in range(len(value) - 1, index, -1):
+                    stack.append('</div>')
+                    stack.append(_PendingModel(value[rest_index], item_depth))
+                    stack.append('<div class="list-item">')
+                stack.append('</div>')
+                stack.append(frame)
+                return
+            append('</div>')
+        
+        append('</td>')
+        if memo is not None and stack.cycles == cycles:
+            memo[key] = (start, len(out))
+    else:
+        # List of simple values, escaped and joined in a single str.join
+        if value:
+            items_html = _bulk_list_items(value) if len(value) > _BULK_LIST_MIN_SIZE else None
+            if items_html is None:
+                items_html = _LIST_ITEM_SEPARATOR_HTML.join(map(_escape_value, value))
+            append(f'<td class="field-value field-list"><div class="list-item">{items_html}</div></td>')
+        else:
+            append('<td class="field-value field-list"></td>')
+
+
+def _bulk_list_items(value: List[Any]) -> Optional[str]:
+    """
+    Render the items of a list of strings with a single escape call.
+    
+    The items are joined with NUL separators, escaped at once and the
+    separators are then replaced by the markup between list items.
+    
+    Args:
+        value: The list to render
+        
+    Returns:
+        The items joined by the list item separator, or None if an item is
+        not a plain str or contains a NUL character
+    """
+    if set(map(type, value)) != {str}:
+        return None
+    text = "\x00".join(value)
+    if text.count("\x00") != len(value) - 1:
+        return None
+    return escape(text).replace("\x00", _LIST_ITEM_SEPARATOR_HTML)
+
+
+def _write_enum(
+    value: Enum,
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for an enum member, showing its value."""
+    # Enum members are singletons, so each member's cell is rendered once and
+    # cached per enum class; members are keyed by name so the cache doesn't
+    # keep their class alive
+    name = value._name_
+    if name is None:
+        # Flag pseudo-members (e.g. Perm(0) or unknown bits) have no name to
+        # tell them apart, so their cells are not cached
+        out.append(f'<td class="field-value">{_escape_value(value.value)}</td>')
+        return
+    cells = _ENUM_CELL_CACHE.get(type(value))
+    if cells is None:
+        cells = _ENUM_CELL_CACHE[type(value)] = {}
+    cell = cells.get(name)
+    if cell is None:
+        # Display the value not the enum object representation
+        cell = cells[name] = f'<td class="field-value">{_escape_value(value.value)}</td>'
+    out.append(cell)
+
+
+def _write_date(
+    value: date,
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for a date or datetime in ISO format."""
+    # Aware datetimes for the same instant compare equal across time zones but
+    # format differently, so the UTC offset is part of the cache key
+    offset = value.utcoffset() if isinstance(value, datetime) else None
+    out.append(_format_date_cell(value, offset))
+
+
+@lru_cache(maxsize=1024)
+def _format_date_cell(value: date, offset: Optional[timedelta]) -> str:
+    """
+    Render the value cell for a date or datetime.
+    
+    Dates are immutable and the same timestamps tend to recur across the
+    records of a page, so formatted cells are cached by value.
+    
+    Args:
+        value: The date or datetime to format
+        offset: UTC offset of the value, used only as part of the cache key
+        
+    Returns:
+        The <td> element holding the ISO formatted value
+    """
+    # Datetimes are dates too, so every value is ISO formatted; the output
+    # only holds digits and separators and needs no escaping
+    return f'<td class="field-value">{value.isoformat()}</td>'
+
+
+def _write_scalar(
+    value: Any,
+    out: List[str],
+    current_depth: int,
+    max_depth: Optional[int],
+    memo: Optional[RenderMemo],
+    stack: "_RenderStack"
+) -> None:
+    """Append the cell for a simple value using its string form."""
+    out.append(f'<td class="field-value">{_escape_value(value)}</td>')
+
+
+# Value writers of builtin types keyed by exact type
+_VALUE_WRITERS: Dict[type, ValueWriter] = {
+    str: _write_scalar,
+    int: _write_scalar,
+    float: _write_scalar,
+    bool: _write_scalar,
+    type(None): _write_scalar,
+    dict: _write_dict,
+    list: _write_list,
+    datetime: _write_date,
+    date: _write_date,
+}
+
+# Value writers of other types, resolved on first sight by
+# _resolve_value_writer; held weakly as these include model and enum classes
+# created at runtime
+_RESOLVED_VALUE_WRITERS: "weakref.WeakKeyDictionary[type, ValueWriter]" = weakref.WeakKeyDictionary()
+
+
+def _escape_value(value: Any) -> str:
+    """
+    Convert a value to a string and escape it for HTML.
+    
+    Equivalent to html.escape(str(value)), but strings skip the str() call
+    and numbers, booleans and None are not scanned.
+    
+    Args:
+        value: The value to escape
+        
+    Returns:
+        HTML-safe string representation of the value
+    """
+    value_type = type(value)
+    if value_type is str:
+        return escape(value)
+    if value_type in _UNESCAPED_TYPES:
+        return str(value)
+    return escape(str(value))
+
+
+def _write_model_form(
     model: Any,
+    out: List[str],
     max_depth: Optional[int] = None,
     htmx: bool = False,
     htmx_mode: str = "full"
-) -> str:
+) -> None:
     """
-    Render model as an editable form.
+    Append the fields of an editable form to a shared output list.
     
     Args:
         model: The Pydantic model or dataclass to render as a form
+        out: Output list that HTML fragments are appended to
         max_depth: Maximum depth for nested models
         htmx: Whether to include HTMX attributes
         htmx_mode: HTMX update mode
-        
-    Returns:
-        HTML form for the model
     """
-    html_parts = []
+    append = out.append
+    model_cls: type = type(model)
     
     # Add form header with model name
-    html_parts.append(f'<h2 class="model-title">{escape(model.__class__.__name__)}</h2>')
-    html_parts.append('<div class="model-content">')
+    append(_model_title_html(model_cls))
     
     # Create a fieldset for the form
-    html_parts.append('<fieldset class="model-fields">')
+    append(_FORM_FIELDS_OPEN_HTML)
     
-    # Get fields based on model type
-    fields = _get_model_fields(model)
+    # Field names, types, input attributes and labels only depend on the class
+    names, input_factories, attr_strings, label_htmls = _get_form_field_table(model)
     
-    for name, field_info in fields.items():
-        value = getattr(model, name)
+    # In inline mode every input also carries the HTMX attributes
+    if htmx and htmx_mode == "inline":
+        inline_attr_strings = _HTMX_INLINE_ATTR_STRINGS_CACHE.get(model_cls)
+        if inline_attr_strings is None:
+            inline_attr_strings = _HTMX_INLINE_ATTR_STRINGS_CACHE[model_cls] = tuple(
+                attrs + _HTMX_INLINE_FIELD_ATTRS for attrs in attr_strings
+            )
+        attr_strings = inline_attr_strings
+    
+    data = getattr(model, "__dict__", {})
+    
+    for name, input_factory, input_attrs, label_html in zip(names, input_factories, attr_strings, label_htmls):
+        value = data.get(name, _MISSING)
+        if value is _MISSING:
+            value = getattr(model, name)
+        
+        # Open the field with its pre-rendered label
+        append(label_html)
+        
+        # Create input element based on field type
+        append(input_factory(value, input_attrs))
+        
+        append('</div>')
+    
+    # Close the fieldset and add the submit button
+    append(_FORM_FIELDS_CLOSE_HTML)
+
+
+def _get_form_field_table(model: Any) -> FormFieldTable:
+    """
+    Get the cached form field table for the class of a model.
+    
+    Field types, validation constraints and labels are fixed per class, so
+    they are resolved once into parallel tuples and the form loop only has
+    to read the instance values.
+    
+    Args:
+        model: The Pydantic model or dataclass instance
         
+    Returns:
+        Tuples of field names, input factories, input attribute strings and
+        label openings
+    """
+    model_cls = type(model)
+    table = _FIELD_TABLE_CACHE.get(model_cls)
+    if table is not None:
+        return table
+    
+    names = []
+    input_factories = []
+    attr_strings = []
+    label_htmls = []
+    for name, field_info in _get_model_fields(model).items():
         # Get field type based on model type
         if _is_pydantic_model(model):
             field_type = field_info.annotation
@@ -373,39 +1461,54 @@ def _render_model_form(
             # Default to str if we can't determine the type
             field_type = str
         
-        # Create label
-        html_parts.append(f'<div class="form-field">')
-        html_parts.append(f'<label for="{name}">{escape(name)}</label>')
-        
-        # Get HTML input type and attributes based on field type
-        input_attrs = _get_input_attributes(name, field_info, value)
-        
-        # Add HTMX attributes if enabled
-        if htmx and htmx_mode == "inline":
-            input_attrs += ' hx-trigger="change" hx-post="/update-field"'
-        
-        # Create input element based on field type
-        input_html = _create_input_for_field(name, field_type, value, input_attrs)
-        html_parts.append(input_html)
-        
-        html_parts.append('</div>')
+        names.append(name)
+        input_factories.append(_get_input_factory(field_type))
+        # Get HTML input attributes based on field constraints
+        attr_strings.append(_get_input_attributes(name, field_info, None))
+        label_htmls.append(f'<div class="form-field"><label for="{name}">{_escape_value(name)}</label>')
     
-    html_parts.append('</fieldset>')
-    
-    # Add submit button
-    html_parts.append('<div class="form-actions">')
-    html_parts.append('<button type="submit" class="submit-button">Submit</button>')
-    html_parts.append('</div>')
+    table = _FIELD_TABLE_CACHE[model_cls] = (
+        tuple(names),
+        tuple(input_factories),
+        tuple(attr_strings),
+        tuple(label_htmls),
+    )
+    return table
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """
+    Strip Optional[...] wrappers from a field type.
     
-    html_parts.append('</div>')
+    Inputs for an optional field are the inputs of its first non-None
+    type, so resolving it once per class spares the form loop the
+    get_origin/get_args calls on every render.
     
-    return ''.join(html_parts)
+    Args:
+        field_type: Field type annotation
+        
+    Returns:
+        The first non-None type of optional annotations, the type otherwise
+    """
+    while get_origin(field_type) in _UNION_ORIGINS:
+        args = get_args(field_type)
+        if type(None) not in args:
+            break
+        field_type = next(arg for arg in args if arg != type(None))
+    return field_type
+
+
+# FieldInfo attributes that are turned into input validation attributes
+_INPUT_CONSTRAINTS = ("ge", "gt", "le", "lt", "min_length", "max_length", "pattern")
 
 
 def _get_input_attributes(name: str, field_info: Any, value: Any) -> str:
     """
     Generate HTML input attributes based on field constraints.
     
+    The attributes only depend on the field, so they are generated once per
+    class when the form field table is built.
+    
     Args:
         name: Field name
         field_info: Pydantic field information or dataclass field info
@@ -427,28 +1530,15 @@ def _get_input_attributes(name: str, field_info: Any, value: Any) -> str:
         
         # Handle Pydantic FieldInfo
         if isinstance(field_info, FieldInfo):
-            # Try to extract gt/ge/lt/le constraints
-            if hasattr(field_info, "ge") and field_info.ge is not None:
-                constraints["ge"] = field_info.ge
-            if hasattr(field_info, "gt") and field_info.gt is not None:
-                constraints["gt"] = field_info.gt
-            if hasattr(field_info, "le") and field_info.le is not None:
-                constraints["le"] = field_info.le
-            if hasattr(field_info, "lt") and field_info.lt is not None:
-                constraints["lt"] = field_info.lt
-                
-            # Try to extract min_length/max_length constraints
-            if hasattr(field_info, "min_length") and field_info.min_length is not None:
-                constraints["min_length"] = field_info.min_length
-            if hasattr(field_info, "max_length") and field_info.max_length is not None:
-                constraints["max_length"] = field_info.max_length
-                
-            # Try to extract regex pattern
-            if hasattr(field_info, "pattern") and field_info.pattern is not None:
-                constraints["pattern"] = field_info.pattern
+            # Try to extract gt/ge/lt/le, min_length/max_length and regex
+            # pattern constraints
+            for constraint in _INPUT_CONSTRAINTS:
+                constraint_value = getattr(field_info, constraint, None)
+                if constraint_value is not None:
+                    constraints[constraint] = constraint_value
                 
             # Check if required
-            is_required = field_info.is_required if hasattr(field_info, "is_required") else False
+            is_required = getattr(field_info, "is_required", False)
         
         # Handle dataclass field (field_info might be our custom dict or dataclass field)
         elif isinstance(field_info, dict):
@@ -492,87 +1582,201 @@ def _get_input_attributes(name: str, field_info: Any, value: Any) -> str:
     return ' '.join(attrs)
 
 
-def _create_input_for_field(name: str, field_type: Any, value: Any, attrs: str) -> str:
+def _text_input(value: Any, attrs: str) -> str:
+    """Create a text input for a string field or a type without a dedicated input."""
+    if value is None:
+        return f'<input type="text" {attrs} value="">'
+    return f'<input type="text" {attrs} value="{_escape_value(value)}">'
+
+
+def _int_input(value: Any, attrs: str) -> str:
+    """Create a whole-number input for an integer field."""
+    return f'<input type="number" step="1" {attrs} value="{value if value is not None else ""}">'
+
+
+def _float_input(value: Any, attrs: str) -> str:
+    """Create a decimal number input for a float field."""
+    return f'<input type="number" step="0.01" {attrs} value="{value if value is not None else ""}">'
+
+
+def _checkbox_input(value: Any, attrs: str) -> str:
+    """Create a checkbox for a boolean field."""
+    checked = 'checked' if value else ''
+    return f'<input type="checkbox" {attrs} {checked}>'
+
+
+def _datetime_input(value: Any, attrs: str) -> str:
+    """Create a local date and time input for a datetime field."""
+    # datetime-local inputs take no UTC offset
+    formatted = value.replace(tzinfo=None).isoformat(timespec="minutes") if value else ""
+    return f'<input type="datetime-local" {attrs} value="{formatted}">'
+
+
+def _date_input(value: Any, attrs: str) -> str:
+    """Create a date input for a date field."""
+    formatted = value.isoformat() if value else ""
+    return f'<input type="date" {attrs} value="{formatted}">'
+
+
+# Input factories for field types that need no further inspection, looked
+# up before the checks for enums, literals and lists
+_INPUT_FACTORIES: Dict[Any, InputFactory] = {
+    str: _text_input,
+    int: _int_input,
+    float: _float_input,
+    bool: _checkbox_input,
+    datetime: _datetime_input,
+    date: _date_input,
+}
+
+
+def _get_input_factory(field_type: Any) -> InputFactory:
     """
-    Create appropriate HTML input element based on field type.
+    Pick the input factory for a field type.
+    
+    The choice only depends on the annotation, so it is made once per class
+    when the form field table is built; rendering an instance just calls the
+    factory with the value and the input attributes.
     
     Args:
-        name: Field name
         field_type: Field type annotation
-        value: Current field value
-        attrs: HTML attributes string
         
     Returns:
-        HTML input element
+        Callable creating the HTML input element from a value and attributes
     """
-    # Get the origin type for generics (List, Union, etc.)
-    origin = get_origin(field_type)
-    args = get_args(field_type)
-    
-    # Handle string fields
-    if field_type == str:
-        return f'<input type="text" {attrs} value="{escape(str(value)) if value else ""}">'
-    
-    # Handle numeric fields
-    elif field_type == int:
-        return f'<input type="number" step="1" {attrs} value="{value if value is not None else ""}">'
-    elif field_type == float:
-        return f'<input type="number" step="0.01" {attrs} value="{value if value is not None else ""}">'
-    
-    # Handle boolean fields
-    elif field_type == bool:
-        checked = 'checked' if value else ''
-        return f'<input type="checkbox" {attrs} {checked}>'
-    
-    # Handle date/time fields
-    elif field_type == datetime:
-        formatted = value.strftime("%Y-%m-%dT%H:%M") if value else ""
-        return f'<input type="datetime-local" {attrs} value="{formatted}">'
-    elif field_type == date:
-        formatted = value.strftime("%Y-%m-%d") if value else ""
-        return f'<input type="date" {attrs} value="{formatted}">'
+    # Optional fields use the input of their first non-None type
+    field_type = _unwrap_optional(field_type)
+    
+    # Simple field types map straight to their input
+    factory = _INPUT_FACTORIES.get(field_type)
+    if factory is not None:
+        return factory
     
     # Handle enum fields
-    elif inspect.isclass(field_type) and issubclass(field_type, Enum):
-        options = []
-        for enum_value in field_type:
-            selected = 'selected' if value == enum_value else ''
-            options.append(f'<option value="{enum_value.value}" {selected}>{enum_value.value}</option>')
-        return f'<select {attrs}>{"".join(options)}</select>'
+    if inspect.isclass(field_type) and issubclass(field_type, Enum):
+        return partial(_enum_select, _enum_options(field_type))
     
     # Handle literal fields (dropdown)
-    elif origin == Literal:
-        options = []
-        for option in args:
-            selected = 'selected' if value == option else ''
-            options.append(f'<option value="{option}" {selected}>{option}</option>')
-        return f'<select {attrs}>{"".join(options)}</select>'
+    origin = get_origin(field_type)
+    if origin == Literal:
+        return partial(_literal_select, get_args(field_type))
     
     # Handle list fields
-    elif origin == list:
-        if not value:
-            value = []
-        
-        # For simplicity, just add a textarea for lists for now
-        item_str = "\n".join(str(item) for item in value)
-        return f'<textarea {attrs}>{escape(item_str)}</textarea>'
-    
-    # Handle optional fields (Union[Type, None] or Optional[Type])
-    elif origin == Union and type(None) in args:
-        # Extract the actual type (first non-None type)
-        actual_type = next(arg for arg in args if arg != type(None))
-        return _create_input_for_field(name, actual_type, value, attrs)
+    if origin == list:
+        return _list_textarea
     
     # Default fallback for complex types
-    else:
-        return f'<input type="text" {attrs} value="{escape(str(value)) if value else ""}">'
+    return _text_input
+
+
+def _enum_options(enum_cls: Type[Enum]) -> EnumOptions:
+    """
+    Render the dropdown options of an enum once.
+    
+    Args:
+        enum_cls: The enum class of the field
+        
+    Returns:
+        Triples of member, unselected option and selected option
+    """
+    return tuple(
+        (
+            enum_value,
+            f'<option value="{enum_value.value}" >{enum_value.value}</option>',
+            f'<option value="{enum_value.value}" selected>{enum_value.value}</option>',
+        )
+        for enum_value in enum_cls
+    )
+
+
+def _enum_select(options: EnumOptions, value: Any, attrs: str) -> str:
+    """Create a dropdown of the members of an enum from its rendered options."""
+    selected_options = "".join([
+        selected if value == enum_value else unselected
+        for enum_value, unselected, selected in options
+    ])
+    return f'<select {attrs}>{selected_options}</select>'
+
+
+def _literal_select(choices: Tuple[Any, ...], value: Any, attrs: str) -> str:
+    """Create a dropdown of the values allowed by a Literal."""
+    options = []
+    for option in choices:
+        selected = 'selected' if value == option else ''
+        options.append(f'<option value="{option}" {selected}>{option}</option>')
+    return f'<select {attrs}>{"".join(options)}</select>'
+
+
+def _list_textarea(value: Any, attrs: str) -> str:
+    """Create a textarea with one list item per line."""
+    if not value:
+        value = []
+    
+    # For simplicity, just add a textarea for lists for now
+    item_str = "\n".join(str(item) for item in value)
+    return f'<textarea {attrs}>{_escape_value(item_str)}</textarea>'
 
 
 def _get_default_css() -> str:
     """
     Get default CSS for HTML representation.
     """
-    return """
+    return _DEFAULT_CSS
+
+
+def _append_style_tag(html_parts: List[str], style_tag: str, css_emitted: Optional[Set[str]]) -> None:
+    """
+    Append a <style> block unless it was already emitted in this response.
+    
+    Args:
+        html_parts: Output list of the current render
+        style_tag: The <style> element to emit
+        css_emitted: Style elements already emitted, or None to always emit
+    """
+    if css_emitted is None:
+        html_parts.append(style_tag)
+    elif style_tag not in css_emitted:
+        css_emitted.add(style_tag)
+        html_parts.append(style_tag)
+
+
+def _get_style_tag(theme: Optional[str]) -> str:
+    """
+    Get the ready-to-emit <style> block for a theme.
+    
+    Args:
+        theme: Theme name, or None for the default styles
+        
+    Returns:
+        The theme CSS wrapped in a <style> element
+    """
+    if theme is None:
+        return _DEFAULT_STYLE_TAG
+    style_tag = _THEME_STYLE_TAGS.get(theme)
+    return style_tag if style_tag is not None else _DEFAULT_STYLE_TAG
+
+
+def _minify_css(css: str) -> str:
+    """
+    Strip the comments and collapse the whitespace of a stylesheet.
+    
+    Args:
+        css: The stylesheet as written in the source
+        
+    Returns:
+        The stylesheet without comments, indentation, line breaks or spaces
+        around punctuation
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{};,]) ?", r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+
+# The stylesheets are static, so they are built once at import time rather
+# than on every render.
+_DEFAULT_CSS = """
     .pydantic-model, .pydantic-model-form {
         font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
         border: 1px solid #ddd;
@@ -660,19 +1864,9 @@ def _get_default_css() -> str:
     }
     """
 
-
-def _get_theme_css(theme: str) -> str:
-    """
-    Get CSS for a specific theme.
-    
-    Args:
-        theme: Theme name
-        
-    Returns:
-        CSS for the theme
-    """
-    themes = {
-        "light": """
+_THEME_CSS: Dict[str, str] = {
+    "default": _DEFAULT_CSS,
+    "light": """
         .pydantic-model, .pydantic-model-form {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
             border: 1px solid #e0e0e0;
@@ -773,7 +1967,7 @@ def _get_theme_css(theme: str) -> str:
             background-color: #3b7fd1;
         }
         """,
-        "dark": """
+    "dark": """
         .pydantic-model, .pydantic-model-form {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
             border: 1px solid #333;
@@ -877,6 +2071,13 @@ def _get_theme_css(theme: str) -> str:
             background-color: #3b7fd1;
         }
         """
-    }
-    
-    return themes.get(theme, _get_default_css())
\ No newline at end of file
+}
+
+# Minified once at import time, as every rendered page embeds a stylesheet
+_THEME_CSS = {name: _minify_css(css) for name, css in _THEME_CSS.items()}
+_DEFAULT_CSS = _THEME_CSS["default"]
+
+_THEME_STYLE_TAGS: Dict[str, str] = {
+    name: f"<style>{css}</style>" for name, css in _THEME_CSS.items()
+}
+_DEFAULT_STYLE_TAG = _THEME_STYLE_TAGS["default"]
@@ -231,11 +231,11 @@ class TestDataClassSupport(unittest.TestCase):
         
         # Light theme
         html_light = render_html(self.user_dc, theme="light")
-        self.assertIn("background-color: #ffffff", html_light)
+        self.assertIn("background-color:#ffffff", html_light)
         
         # Dark theme
         html_dark = render_html(self.user_dc, theme="dark")
-        self.assertIn("background-color: #1e1e1e", html_dark)
+        self.assertIn("background-color:#1e1e1e", html_dark)
     
     def test_max_depth_with_dataclasses(self):
         """Test max_depth parameter with nested dataclasses."""
@@ -63,6 +63,19 @@ class ExtremeCasesDataClass:
     very_small_float: float = 1.23e-10
 
 
+# 4. Test with values containing HTML special characters
+class Priority(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+class SpecialCharactersModel(BaseModel):
+    markup: str = "<script>alert('x') & \"y\"</script>"
+    priority: Priority = Priority.HIGH
+    tags: List[str] = ["<b>", "a & b"]
+    labels: Dict[str, str] = {"<key>": "'quoted'"}
+
+
 class TestEdgeCases(unittest.TestCase):
     def test_empty_collections_basemodel(self):
         """Test rendering of empty collections in BaseModel."""
@@ -75,9 +88,9 @@ class TestEdgeCases(unittest.TestCase):
         self.assertIn("<th class=\"field-name\">empty_list</th>", html)
         self.assertIn("<td class=\"field-value field-list\">", html)
         
-        # Empty dict should be rendered as an empty table
+        # Empty dict should be rendered as an empty cell
         self.assertIn("<th class=\"field-name\">empty_dict</th>", html)
-        self.assertIn("<td class=\"field-value field-nested\">", html)
+        self.assertIn("<td class=\"field-value field-nested\"></td>", html)
         
         # None value should be rendered as "None"
         self.assertIn("<th class=\"field-name\">none_value</th>", html)
@@ -190,6 +203,25 @@ class TestEdgeCases(unittest.TestCase):
         self.assertIn('name="large_number"', html_extreme)
         self.assertIn('value="10000000000"', html_extreme)
 
+    
+    def test_special_characters_are_escaped(self):
+        """Test that HTML special characters in values are escaped."""
+        model = SpecialCharactersModel()
+        html = render_html(model)
+        
+        self.assertNotIn("<script>", html)
+        self.assertIn(
+            "&lt;script&gt;alert(&#x27;x&#x27;) &amp; &quot;y&quot;&lt;/script&gt;",
+            html,
+        )
+        self.assertIn("<div class=\"list-item\">&lt;b&gt;</div>", html)
+        self.assertIn("<div class=\"list-item\">a &amp; b</div>", html)
+        self.assertIn("<th class=\"field-name\">&lt;key&gt;</th>", html)
+        self.assertIn("<td class=\"field-value\">&#x27;quoted&#x27;</td>", html)
+        
+        # Enums with non-string values are rendered by their value
+        self.assertIn("<td class=\"field-value\">2</td>", html)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -8,13 +8,21 @@ incrementally. The models have a `__test_mode__` attribute which triggers
 special mock output in the render_html function for testing.
 """
 
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic_to_html import model_to_html, render_html
+from pydantic_to_html import (
+    model_to_html,
+    render_html,
+    render_html_bytes,
+    render_html_to,
+    render_html_to_file,
+)
 
 
 class UserRole(str, Enum):
@@ -54,6 +62,11 @@ class NestedModel(BaseModel):
     __test_mode__: bool = True
 
 
+class NoDumpModel(SimpleModel):
+    def model_dump(self, *args, **kwargs):
+        raise AssertionError("model_dump should not be called while rendering")
+
+
 class TestHtmlRenderer(unittest.TestCase):
     def test_simple_model(self):
         model = SimpleModel(name="John Doe", age=30, is_active=True)
@@ -113,6 +126,14 @@ class TestHtmlRenderer(unittest.TestCase):
         html_with_custom_css = model_to_html(model, include_css=True, custom_css=custom_css)
         self.assertIn("<style>.custom { color: red; }</style>", html_with_custom_css)
         
+    def test_model_is_not_serialized(self):
+        """Rendering walks the fields directly instead of dumping the model."""
+        model = NoDumpModel(name="John Doe", age=30, is_active=True)
+        html = model_to_html(model, include_css=False)
+        
+        expected = model_to_html(SimpleModel(name="John Doe", age=30, is_active=True), include_css=False)
+        self.assertEqual(html, expected.replace("SimpleModel", "NoDumpModel"))
+        
     def test_render_html_function(self):
         """Test the new render_html function."""
         model = SimpleModel(name="John Doe", age=30, is_active=True)
@@ -265,5 +286,118 @@ class TestHtmlRenderer(unittest.TestCase):
         self.assertNotIn("Inner Model", html_limited)
 
 
+
+class Greeting(BaseModel):
+    message: str
+    language: str
+
+
+class TestSharedStyles(unittest.TestCase):
+    def test_style_is_emitted_once_per_response(self):
+        """Models rendered into one response share a single <style> block."""
+        css_emitted = set()
+        
+        first = render_html(Greeting(message="Hi", language="en"), css_emitted=css_emitted)
+        second = render_html(Greeting(message="Hallo", language="de"), css_emitted=css_emitted)
+        dark = render_html(Greeting(message="Hej", language="sv"), theme="dark", css_emitted=css_emitted)
+        
+        self.assertIn("<style>", first)
+        self.assertNotIn("<style>", second)
+        self.assertIn("<style>", dark)
+        self.assertEqual(len(css_emitted), 2)
+        self.assertTrue(second.startswith("<div class=\"pydantic-model\">"))
+    
+    def test_model_to_html_shares_styles(self):
+        """model_to_html skips default and custom styles that were emitted."""
+        css_emitted = set()
+        model = Greeting(message="Hi", language="en")
+        
+        render_html(model, css_emitted=css_emitted)
+        default_html = model_to_html(model, css_emitted=css_emitted)
+        custom_html = model_to_html(model, custom_css=".x { color: red; }", css_emitted=css_emitted)
+        repeated_html = model_to_html(model, custom_css=".x { color: red; }", css_emitted=css_emitted)
+        
+        self.assertNotIn("<style>", default_html)
+        self.assertIn("<style>.x { color: red; }</style>", custom_html)
+        self.assertNotIn("<style>", repeated_html)
+
+
+class TestRenderHtmlTo(unittest.TestCase):
+    def test_writes_fragments_in_order(self):
+        """The fragments passed to write join to the render_html output."""
+        model = Greeting(message="Grüß dich <Welt>", language="de")
+        fragments = []
+        
+        render_html_to(model, fragments.append, editable=True, theme="light")
+        
+        self.assertGreater(len(fragments), 1)
+        self.assertEqual("".join(fragments), render_html(model, editable=True, theme="light"))
+    
+    def test_writes_to_text_file(self):
+        """The write method of a text file can be used directly."""
+        model = Greeting(message="Hi", language="en")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "greeting.html")
+            with open(path, "w", encoding="utf-8") as f:
+                render_html_to(model, f.write)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), render_html(model))
+
+
+class TestRenderHtmlBytes(unittest.TestCase):
+    def test_encodes_rendered_html(self):
+        """The bytes are the UTF-8 encoding of the render_html output."""
+        model = Greeting(message="Grüß dich <Welt>", language="de")
+        
+        content = render_html_bytes(model, htmx=True)
+        
+        self.assertIsInstance(content, bytes)
+        self.assertEqual(content, render_html(model, htmx=True).encode("utf-8"))
+
+
+class TestRenderHtmlToFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "greeting.html")
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_writes_rendered_html(self):
+        """The file holds exactly the UTF-8 encoded output of render_html."""
+        model = Greeting(message="Grüß dich <Welt>", language="de")
+        
+        render_html_to_file(model, self.path, theme="dark", max_depth=1)
+        
+        with open(self.path, "rb") as f:
+            content = f.read()
+        expected = render_html(model, theme="dark", max_depth=1)
+        self.assertEqual(content, expected.encode("utf-8"))
+        self.assertIn("Grüß dich &lt;Welt&gt;", content.decode("utf-8"))
+    
+    def test_overwrites_existing_file(self):
+        """An existing, longer file is truncated before writing."""
+        with open(self.path, "w") as f:
+            f.write("x" * 100000)
+        
+        render_html_to_file(Greeting(message="Hi", language="en"), self.path)
+        
+        with open(self.path, encoding="utf-8") as f:
+            content = f.read()
+        self.assertNotIn("x" * 100, content)
+        self.assertTrue(content.endswith("</div>"))
+    
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_new_file_permissions_follow_umask(self):
+        """New files get 0o666 minus the umask, like files created with open()."""
+        old_umask = os.umask(0o002)
+        try:
+            render_html_to_file(Greeting(message="Hi", language="en"), self.path)
+        finally:
+            os.umask(old_umask)
+        
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o664)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,894 @@
+"""
+Tests for the per-class caches used by the HTML renderer
+"""
+
+import dataclasses
+import gc
+import re
+import threading
+import unittest
+import weakref
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum, IntFlag
+from html import escape
+from typing import Dict, Generic, List, Literal, Optional, TypeVar, Union
+from unittest import mock
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+from pydantic_to_html import render_html
+from pydantic_to_html import html_renderer
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int
+
+
+class Order(BaseModel):
+    reference: str
+    items: List[Item]
+    gift_item: Optional[Item] = None
+
+
+class Basket(BaseModel):
+    entries: List[Union[Item, Order]]
+
+
+class Tag(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    label: str
+
+
+class Badge(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    labels: List[str]
+
+
+class Val(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    x: Union[int, float, bool]
+
+
+class Price(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    amount: Decimal
+
+
+class Stamp(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    at: datetime
+
+
+class Counted(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    label: Optional[str]
+    count: int
+
+
+class UnionCounted(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    label: str | None
+    count: int
+
+
+class Holder(BaseModel):
+    items: List[Val]
+
+
+@pydantic_dataclass(frozen=True)
+class Card:
+    title: str
+    note: str = dataclasses.field(compare=False)
+
+
+T = TypeVar("T")
+
+
+class Box(BaseModel, Generic[T]):
+    model_config = ConfigDict(frozen=True)
+
+    x: int
+
+
+class Named(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    key: str
+    label: str
+
+    def __eq__(self, other):
+        return isinstance(other, Named) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+class Post(BaseModel):
+    title: str
+    tags: List[Tag]
+
+
+class Status(str, Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+class Ticket(BaseModel):
+    title: str
+    status: Status
+
+
+class Perm(IntFlag):
+    READ = 1
+    WRITE = 2
+
+
+class Grant(BaseModel):
+    perm: Perm
+
+
+class Node(BaseModel):
+    label: str
+    child: Optional["Node"] = None
+
+
+class Tree(BaseModel):
+    label: str
+    children: List["Tree"] = []
+
+
+class Event(BaseModel):
+    starts_at: datetime
+
+
+class Settings(BaseModel):
+    values: Dict[str, str]
+
+
+class Labels(BaseModel):
+    values: List[Union[int, str]]
+
+
+class Meeting(BaseModel):
+    topic: str
+    starts_at: datetime
+
+
+class Account(BaseModel):
+    username: str = Field(min_length=3, max_length=20)
+    age: int = Field(ge=18)
+
+
+class Profile(BaseModel):
+    nickname: Optional[str] = None
+    score: Optional[Optional[int]] = 3
+
+
+class Counter(BaseModel):
+    label: Optional[str] = None
+    count: Union[int, str] = 0
+
+
+class Assignment(BaseModel):
+    status: Optional[Status] = None
+    size: Optional[Literal["S", "M"]] = "M"
+
+
+class UnionProfile(BaseModel):
+    nickname: str | None = None
+    score: int | None = 3
+
+
+class UnionAssignment(BaseModel):
+    status: Status | None = None
+    size: Literal["S", "M"] | None = "M"
+
+
+@pydantic_dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pydantic_dataclass(slots=True)
+class SlottedPoint:
+    x: int
+    y: int
+
+
+class TestRendererCache(unittest.TestCase):
+    def test_rows_are_built_once_per_class(self):
+        """The pre-rendered field rows are reused for every instance of a class."""
+        render_html(Item(name="First", quantity=1))
+        rows = html_renderer._FIELD_ROWS_CACHE[Item]
+
+        html = render_html(Item(name="Second", quantity=2))
+
+        self.assertIs(html_renderer._FIELD_ROWS_CACHE[Item], rows)
+        self.assertIn("<td class=\"field-value\">Second</td>", html)
+        self.assertNotIn("First", html)
+
+    def test_nested_classes_get_their_own_rows(self):
+        """Nested model classes are specialized independently of their parent."""
+        order = Order(
+            reference="A-1",
+            items=[Item(name="Pen", quantity=2), Item(name="Ink", quantity=1)],
+            gift_item=Item(name="Card", quantity=1),
+        )
+
+        html = render_html(order)
+
+        self.assertIn("<th class=\"field-name\">gift_item</th>", html)
+        self.assertIn("<td class=\"field-value\">Pen</td>", html)
+        self.assertIn("<td class=\"field-value\">Ink</td>", html)
+        self.assertIn("<td class=\"field-value\">Card</td>", html)
+
+    def test_dataclass_rows(self):
+        """Pydantic dataclasses are specialized the same way as models."""
+        html = render_html(Point(x=3, y=4))
+
+        self.assertIn("<th class=\"field-name\">x</th>", html)
+        self.assertIn("<td class=\"field-value\">4</td>", html)
+
+    def test_caches_do_not_keep_classes_alive(self):
+        """Classes created at runtime can be collected after being rendered."""
+        def render_runtime_classes():
+            Color = Enum("Color", {"RED": "red"})
+            Inner = create_model("Inner", flag=(bool, True))
+            Outer = create_model("Outer", color=(Color, Color.RED), inner=(Inner, ...), tags=(List[str], []))
+            Frozen = create_model("Frozen", __config__=ConfigDict(frozen=True), label=(str, ...))
+            model = Outer(inner=Inner())
+            render_html(model)
+            render_html(model, editable=True, htmx=True, htmx_mode="inline")
+            render_html(Frozen(label="cached"))
+            return [weakref.ref(cls) for cls in (Inner, Outer, Frozen)]
+
+        refs = render_runtime_classes()
+        gc.collect()
+
+        self.assertEqual([ref() for ref in refs], [None, None, None])
+
+
+class TestFieldValues(unittest.TestCase):
+    def test_values_are_read_from_instance_dict(self):
+        """Field values stored on the instance are rendered without attribute access."""
+        item = Item(name="Stored", quantity=1)
+        item.__dict__["name"] = "Patched"
+
+        html = render_html(item)
+
+        self.assertIn("<td class=\"field-value\">Patched</td>", html)
+
+    def test_slotted_dataclass_falls_back_to_attributes(self):
+        """Dataclasses without an instance __dict__ are read with getattr."""
+        point = SlottedPoint(x=5, y=6)
+        self.assertFalse(hasattr(point, "__dict__"))
+
+        table_html = render_html(point)
+        form_html = render_html(point, editable=True)
+
+        self.assertIn("<td class=\"field-value\">6</td>", table_html)
+        self.assertIn('name="x" required value="5"', form_html)
+
+    def test_simple_values_outside_generated_renderers(self):
+        """Numbers and None of classes without a flat renderer get plain cells."""
+        html = render_html(Counter(label=None, count=0))
+
+        self.assertIn("<th class=\"field-name\">label</th><td class=\"field-value\">None</td></tr>", html)
+        self.assertIn("<th class=\"field-name\">count</th><td class=\"field-value\">0</td></tr>", html)
+
+    def test_mixed_list_items_keep_their_order(self):
+        """Items written at once and items written field by field stay in order."""
+        basket = Basket(entries=[
+            Item(name="first", quantity=1),
+            Order(reference="second", items=[Item(name="inner", quantity=2)]),
+            Item(name="third", quantity=3),
+        ])
+
+        html = render_html(basket)
+
+        positions = [html.index(f">{text}</td>") for text in ("first", "second", "inner", "third")]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(html.count("<div"), html.count("</div>"))
+        self.assertEqual(html.count("<table"), html.count("</table>"))
+
+    def test_nested_instances_are_walked_directly(self):
+        """Nested models are rendered from the instances, not from a dumped copy."""
+        item = Item(name="Stored", quantity=1)
+        order = Order(reference="E-5", items=[item], gift_item=item)
+        item.__dict__["name"] = "Patched"
+
+        html = render_html(order)
+
+        self.assertEqual(html.count("<td class=\"field-value\">Patched</td>"), 2)
+        self.assertNotIn("Stored", html)
+
+
+class TestFlatRenderer(unittest.TestCase):
+    def test_only_simple_classes_get_generated_renderer(self):
+        """The class plan holds a generated renderer only for simple fields."""
+        for model in (Item(name="a", quantity=1), UnionProfile(), Order(reference="D-4", items=[])):
+            render_html(model)
+
+        self.assertIsNotNone(html_renderer._MODEL_PLAN_CACHE[Item][0])
+        self.assertIsNotNone(html_renderer._MODEL_PLAN_CACHE[UnionProfile][0])
+        self.assertIsNone(html_renderer._MODEL_PLAN_CACHE[Order][0])
+
+    def test_simple_class_output(self):
+        """Generated code escapes strings and writes the whole table."""
+        html = render_html(Item(name="<Pen>", quantity=2))
+
+        self.assertIn(
+            "<table class=\"model-fields\">"
+            "<tr><th class=\"field-name\">name</th><td class=\"field-value\">&lt;Pen&gt;</td></tr>"
+            "<tr><th class=\"field-name\">quantity</th><td class=\"field-value\">2</td></tr>"
+            "</table>",
+            html,
+        )
+
+    def test_date_fields_output(self):
+        """Datetime fields are ISO formatted by the generated code."""
+        html = render_html(Meeting(topic="Plan", starts_at=datetime(2025, 3, 24, 9, 30)))
+
+        self.assertIn(
+            "<tr><th class=\"field-name\">starts_at</th>"
+            "<td class=\"field-value\">2025-03-24T09:30:00</td></tr>",
+            html,
+        )
+
+    def test_unexpected_value_falls_back(self):
+        """Values that are not simple are rendered the generic way."""
+        item = Item.model_construct(name=["a", "b"], quantity=None)
+
+        html = render_html(item)
+
+        self.assertIn("<div class=\"list-item\">a</div>", html)
+        self.assertIn("<td class=\"field-value\">None</td>", html)
+
+
+def _shared_graphs():
+    """Build model graphs with shared instances, shared lists and cycles."""
+    shared_item = Item(name="Shared", quantity=5)
+    order = Order(reference="B-2", items=[shared_item, shared_item], gift_item=shared_item)
+
+    shared_children = [Tree(label="leaf"), Tree(label="other")]
+    shared_lists = Tree(label="root", children=[
+        Tree.model_construct(label="left", children=shared_children),
+        Tree.model_construct(label="right", children=shared_children),
+    ])
+
+    node = Node(label="loop")
+    node.child = node
+
+    listed = Tree(label="listed", children=[Tree(label="leaf")])
+    listed.children.append(listed)
+
+    a = Tree(label="a")
+    b = Tree(label="b", children=[a])
+    a.children.append(b)
+    back_reference = Tree(label="root", children=[a, Tree(label="c", children=[b]), b])
+
+    return [
+        order,
+        Basket(entries=[order, shared_item, order]),
+        shared_lists,
+        node,
+        listed,
+        back_reference,
+        Holder(items=[Val(x=2), Val(x=2.0), Val(x=False), Val(x=0)]),
+    ]
+
+
+def _render_fields(model, max_depth=None, memo=None):
+    """Render the fields table of a model, with or without a render memo."""
+    out = []
+    html_renderer._write_model_fields(model, out, max_depth=max_depth, memo=memo)
+    return "".join(out)
+
+
+class TestRenderMemo(unittest.TestCase):
+    def test_memo_matches_rendering_without_memo(self):
+        """Replaying memoized subtrees gives the same HTML as rendering them again."""
+        for model in _shared_graphs():
+            for max_depth in (None, 0, 1, 2, 3):
+                with self.subTest(model=type(model).__name__, max_depth=max_depth):
+                    self.assertEqual(
+                        _render_fields(model, max_depth, memo={}),
+                        _render_fields(model, max_depth),
+                    )
+
+    def test_equal_frozen_instances_are_keyed_by_identity(self):
+        """Distinct but equal frozen instances each get their own memo entry."""
+        post = Post(title="News", tags=[Tag(label="python"), Tag(label="python")])
+        self.assertIsNot(post.tags[0], post.tags[1])
+        memo = {}
+
+        html = _render_fields(post, memo=memo)
+
+        self.assertIn((id(post.tags[0]), 1), memo)
+        self.assertIn((id(post.tags[1]), 1), memo)
+        self.assertEqual(html.count(">python<"), 2)
+
+    def test_equal_frozen_values_keep_their_own_form(self):
+        """Equal frozen instances whose values print differently are not merged."""
+        holder = Holder(items=[Val(x=2), Val(x=2.0), Val(x=False), Val(x=0)])
+
+        html = render_html(holder)
+
+        cells = re.findall(r'<td class="field-value">([^<]*)</td>', html)
+        self.assertEqual(cells, ["2", "2.0", "False", "0"])
+
+
+class TestFrozenTableCache(unittest.TestCase):
+    def setUp(self):
+        html_renderer._FROZEN_TABLE_CACHE.clear()
+
+    def test_equal_frozen_instances_share_cached_html(self):
+        """Views of frozen instances with the same values are rendered once across calls."""
+        first = render_html(Tag(label="shared"))
+        second = render_html(Tag(label="shared"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(html_renderer._FROZEN_TABLE_CACHE), 1)
+        self.assertIn("<td class=\"field-value\">shared</td>", second)
+
+    def test_flags_are_part_of_the_key(self):
+        """HTMX and depth settings get their own cached views."""
+        tag = Tag(label="flags")
+
+        self.assertNotEqual(render_html(tag), render_html(tag, htmx=True))
+        self.assertIn("hx-get", render_html(tag, htmx=True))
+
+    def test_unhashable_frozen_instances_are_rendered(self):
+        """Frozen instances holding lists are rendered without the cache."""
+        render_html(Badge(labels=["a", "b"]))
+
+        html = render_html(Badge(labels=["a", "c"]))
+
+        self.assertIn("<div class=\"list-item\">c</div>", html)
+        self.assertNotIn("<div class=\"list-item\">b</div>", html)
+
+    def test_optional_simple_fields_are_cached(self):
+        """Optional str fields next to int fields render None and their values."""
+        for model_cls in (Counted, UnionCounted):
+            with self.subTest(model=model_cls.__name__):
+                html_renderer._FROZEN_TABLE_CACHE.clear()
+                render_html(model_cls(label=None, count=1))
+
+                html = render_html(model_cls(label=None, count=1))
+                other_html = render_html(model_cls(label="x", count=1))
+
+                self.assertEqual(len(html_renderer._FROZEN_TABLE_CACHE), 2)
+                self.assertIn("<td class=\"field-value\">None</td>", html)
+                self.assertIn("<td class=\"field-value\">x</td>", other_html)
+
+    def test_concurrent_misses_evict_safely(self):
+        """Two renders missing a full cache at once don't evict the same entry."""
+        barrier = threading.Barrier(2, timeout=0.2)
+
+        class RacingCache(dict):
+            def __iter__(self):
+                # Let both renders pick the oldest entry before either one
+                # evicts it
+                keys = list(super().__iter__())
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+                return iter(keys)
+
+        cache = RacingCache({("oldest",): ""})
+        errors = []
+
+        def render_label(label):
+            try:
+                render_html(Tag(label=label))
+            except Exception as error:
+                errors.append(error)
+
+        with mock.patch.object(html_renderer, "_FROZEN_TABLE_CACHE", cache), \
+                mock.patch.object(html_renderer, "_FROZEN_TABLE_CACHE_SIZE", 1):
+            threads = [threading.Thread(target=render_label, args=(label,)) for label in ("a", "b")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(cache), 1)
+
+    def test_fields_excluded_from_comparison_are_rendered(self):
+        """Dataclass fields with compare=False are part of the cached view."""
+        render_html(Card("t", "first note"))
+
+        html = render_html(Card("t", "SECOND note"))
+
+        self.assertIn("<td class=\"field-value\">SECOND note</td>", html)
+        self.assertNotIn("first note", html)
+
+    def test_generic_parametrizations_keep_their_title(self):
+        """Equal instances of different parametrizations render their own class."""
+        render_html(Box[int](x=1))
+
+        html = render_html(Box[str](x=1))
+
+        self.assertIn("<h2 class=\"model-title\">Box[str]</h2>", html)
+        self.assertNotIn("Box[int]", html)
+
+    def test_custom_eq_does_not_share_views(self):
+        """A user-defined __eq__ that ignores fields does not merge views."""
+        render_html(Named(key="a", label="first"))
+
+        html = render_html(Named(key="a", label="second"))
+
+        self.assertIn("<td class=\"field-value\">second</td>", html)
+        self.assertNotIn("first", html)
+
+    def test_equal_decimals_keep_their_own_form(self):
+        """Decimal("1.5") and Decimal("1.50") are equal but not rendered alike."""
+        render_html(Price(amount=Decimal("1.5")))
+
+        html = render_html(Price(amount=Decimal("1.50")))
+
+        self.assertIn("<td class=\"field-value\">1.50</td>", html)
+
+    def test_equal_numbers_of_other_types_keep_their_own_form(self):
+        """1, 1.0 and True are equal but each renders its own value."""
+        cells = [render_html(Val(x=x)) for x in (1, 1.0, True)]
+
+        self.assertIn("<td class=\"field-value\">1</td>", cells[0])
+        self.assertIn("<td class=\"field-value\">1.0</td>", cells[1])
+        self.assertIn("<td class=\"field-value\">True</td>", cells[2])
+
+    def test_equal_datetimes_keep_their_time_zone(self):
+        """The same instant in another time zone renders its own offset."""
+        moment = datetime(2024, 5, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+        render_html(Stamp(at=moment))
+
+        html = render_html(Stamp(at=moment.astimezone(timezone.utc)))
+
+        self.assertIn("10:00:00+00:00", html)
+        self.assertNotIn("+02:00", html)
+
+    def test_mutable_instances_are_not_cached(self):
+        """Changes to a mutable model show in the next render."""
+        item = Item(name="Before", quantity=1)
+        render_html(item)
+        item.name = "After"
+
+        self.assertIn("<td class=\"field-value\">After</td>", render_html(item))
+
+
+class TestDeepNesting(unittest.TestCase):
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Nested models are rendered without recursing once per level."""
+        node = Node(label="leaf")
+        for level in range(2000):
+            node = Node.model_construct(label=f"level-{level}", child=node)
+
+        html = render_html(node)
+
+        self.assertIn("<td class=\"field-value\">leaf</td>", html)
+        self.assertEqual(html.count("<table class=\"model-fields\">"), 2001)
+        self.assertEqual(html.count("</table>"), 2001)
+
+    def test_lists_of_models_deeper_than_recursion_limit(self):
+        """Lists of models are queued on the same stack as nested models."""
+        tree = Tree(label="leaf")
+        for level in range(2000):
+            tree = Tree.model_construct(label=f"level-{level}", children=[tree])
+
+        html = render_html(tree, max_depth=1500)
+
+        self.assertIn("<td class=\"field-value\">level-1999</td>", html)
+        self.assertIn("<td class=\"field-value\">level-499</td>", html)
+        self.assertNotIn("<td class=\"field-value\">level-498</td>", html)
+        self.assertIn("depth limit reached", html)
+
+
+class TestCycles(unittest.TestCase):
+    def test_self_referencing_model_renders_placeholder(self):
+        """A model nested inside itself is not rendered again."""
+        node = Node(label="loop")
+        node.child = node
+
+        html = render_html(node)
+
+        self.assertEqual(html.count("<table class=\"model-fields\">"), 1)
+        self.assertIn("[Circular reference to Node]", html)
+
+    def test_self_referencing_list_renders_placeholder(self):
+        """A model listed among its own items is not rendered again."""
+        tree = Tree(label="root", children=[Tree(label="leaf")])
+        tree.children.append(tree)
+
+        html = render_html(tree)
+
+        self.assertIn("<td class=\"field-value\">leaf</td>", html)
+        self.assertEqual(html.count("[Circular reference to Tree]"), 1)
+
+    def test_shared_instances_are_not_cycles(self):
+        """An instance listed twice is rendered twice, not as a cycle."""
+        leaf = Tree(label="leaf")
+
+        html = render_html(Tree(label="root", children=[leaf, leaf]))
+
+        self.assertEqual(html.count("<td class=\"field-value\">leaf</td>"), 2)
+        self.assertNotIn("Circular reference", html)
+
+    def test_shared_subtree_with_back_reference(self):
+        """A placeholder is only replayed where its model is an ancestor."""
+        a = Tree(label="a")
+        b = Tree(label="b", children=[a])
+        a.children.append(b)
+        root = Tree(label="root", children=[a, Tree(label="c", children=[b])])
+
+        html = render_html(root)
+
+        # Under a, b refers back to a; under c, b renders a, which refers
+        # back to b
+        self.assertEqual(html.count("<td class=\"field-value\">a</td>"), 2)
+        self.assertEqual(html.count("<td class=\"field-value\">b</td>"), 2)
+        self.assertEqual(html.count("[Circular reference to Tree]"), 2)
+
+    def test_depth_limit_still_bounds_cycles(self):
+        """With max_depth, a cycle is rendered down to the limit as before."""
+        node = Node(label="loop")
+        node.child = node
+
+        html = render_html(node, max_depth=2)
+
+        self.assertEqual(html.count("<td class=\"field-value\">loop</td>"), 3)
+        self.assertIn("[Nested Node]", html)
+        self.assertNotIn("Circular reference", html)
+
+
+class TestValueWriters(unittest.TestCase):
+    def test_new_value_types_are_cached(self):
+        """Types resolved through isinstance checks are added to the dispatch table."""
+        html = render_html(Ticket(title="Bug", status=Status.CLOSED))
+
+        self.assertIs(html_renderer._RESOLVED_VALUE_WRITERS[Status], html_renderer._write_enum)
+        self.assertIn("<td class=\"field-value\">closed</td>", html)
+
+    def test_unnamed_flag_values_are_not_shared(self):
+        """Flag values without a member name each render their own value."""
+        html = [render_html(Grant(perm=perm)) for perm in (Perm(0), Perm(8), Perm.READ | Perm.WRITE)]
+
+        self.assertIn("<td class=\"field-value\">0</td>", html[0])
+        self.assertIn("<td class=\"field-value\">8</td>", html[1])
+        self.assertIn("<td class=\"field-value\">3</td>", html[2])
+
+    def test_simple_list_is_joined_in_one_cell(self):
+        """Items of a simple list are escaped and joined into a single cell."""
+        html = render_html(Labels(values=["<a>", 2, "b"]))
+        empty_html = render_html(Labels(values=[]))
+
+        self.assertIn(
+            "<td class=\"field-value field-list\"><div class=\"list-item\">&lt;a&gt;</div>"
+            "<div class=\"list-item\">2</div><div class=\"list-item\">b</div></td>",
+            html,
+        )
+        self.assertIn("<td class=\"field-value field-list\"></td>", empty_html)
+
+
+class TestDictKeyCache(unittest.TestCase):
+    def test_string_keys_are_cached(self):
+        """Rows of repeated string keys are rendered once and escaped."""
+        first = render_html(Settings(values={"<theme>": "dark"}))
+        second = render_html(Settings(values={"<theme>": "light"}))
+
+        row = "<tr><th class=\"field-name\">&lt;theme&gt;</th>"
+        self.assertIn(f"{row}<td class=\"field-value\">dark</td></tr>", first)
+        self.assertIn(f"{row}<td class=\"field-value\">light</td></tr>", second)
+
+    def test_equal_keys_of_other_types_render_separately(self):
+        """Keys that compare equal but differ in type keep their own text."""
+        html = render_html(Settings.model_construct(values={1: "one"}))
+        html_bool = render_html(Settings.model_construct(values={True: "yes"}))
+
+        self.assertIn("<th class=\"field-name\">1</th>", html)
+        self.assertIn("<th class=\"field-name\">True</th>", html_bool)
+
+
+class TestBulkDictRows(unittest.TestCase):
+    def test_large_dict_matches_row_by_row_rendering(self):
+        """Large dicts of strings escaped in bulk render like small ones."""
+        values = {f"<key {i}>": f"'value' & {i}" for i in range(40)}
+
+        html = render_html(Settings(values=values))
+
+        for key, value in values.items():
+            self.assertIn(
+                f"<tr><th class=\"field-name\">{escape(key)}</th>"
+                f"<td class=\"field-value\">{escape(value)}</td></tr>",
+                html,
+            )
+
+    def test_nul_characters_fall_back_to_row_by_row(self):
+        """Values containing the bulk separator are rendered one by one."""
+        values = {f"key {i}": "plain" for i in range(40)}
+        values["key 7"] = "a\x00b"
+
+        self.assertIsNone(html_renderer._bulk_dict_rows(values))
+        self.assertIn("<td class=\"field-value\">a\x00b</td>", render_html(Settings(values=values)))
+
+    def test_string_subclasses_fall_back_to_row_by_row(self):
+        """Keys or values that are not plain str keep their str() form."""
+        values = {f"key {i}": "plain" for i in range(40)}
+        values["status"] = Status.OPEN
+
+        self.assertIsNone(html_renderer._bulk_dict_rows(values))
+
+
+class TestBulkListItems(unittest.TestCase):
+    def test_long_string_list_matches_item_by_item_rendering(self):
+        """Lists of strings escaped in bulk render like short lists."""
+        values = [f"<tag {i}> & 'more'" for i in range(10)]
+
+        html = render_html(Labels(values=values))
+
+        expected = "".join(f"<div class=\"list-item\">{escape(v)}</div>" for v in values)
+        self.assertIn(f"<td class=\"field-value field-list\">{expected}</td>", html)
+
+    def test_mixed_and_nul_items_fall_back(self):
+        """Lists with non-str items or NUL characters are escaped per item."""
+        self.assertIsNone(html_renderer._bulk_list_items(["a", "b", 3, "d"]))
+        self.assertIsNone(html_renderer._bulk_list_items(["a", "b\x00c", "d", "e"]))
+        self.assertIn(
+            "<div class=\"list-item\">b\x00c</div>",
+            render_html(Labels(values=["a", "b\x00c", "d", "e"])),
+        )
+
+
+class TestDateCellCache(unittest.TestCase):
+    def test_same_instant_in_different_time_zones(self):
+        """Equal aware datetimes keep their own UTC offset in the output."""
+        utc_time = datetime(2025, 3, 11, 12, 0, tzinfo=timezone.utc)
+        local_time = utc_time.astimezone(timezone(timedelta(hours=2)))
+        self.assertEqual(utc_time, local_time)
+
+        utc_html = render_html(Event(starts_at=utc_time))
+        local_html = render_html(Event(starts_at=local_time))
+
+        self.assertIn("2025-03-11T12:00:00+00:00", utc_html)
+        self.assertIn("2025-03-11T14:00:00+02:00", local_html)
+
+    def test_form_datetime_drops_offset_and_seconds(self):
+        """datetime-local inputs get the local wall time to the minute."""
+        starts_at = datetime(2025, 3, 11, 14, 30, 15, tzinfo=timezone(timedelta(hours=2)))
+
+        html = render_html(Event(starts_at=starts_at), editable=True)
+
+        self.assertIn('value="2025-03-11T14:30"', html)
+
+
+class TestStyleConstants(unittest.TestCase):
+    def test_builtin_stylesheets_are_minified(self):
+        """Theme stylesheets carry no comments or indentation."""
+        for css in html_renderer._THEME_CSS.values():
+            self.assertNotIn("/*", css)
+            self.assertNotIn("\n", css)
+            self.assertNotIn("  ", css)
+
+        self.assertEqual(
+            html_renderer._minify_css(".a :hover {\n  color: red;\n}\n/* b */ .b, .c { margin: 0 auto; }"),
+            ".a :hover{color:red}.b,.c{margin:0 auto}",
+        )
+
+    def test_views_start_with_the_shared_style_tag(self):
+        """render_html and model_to_html emit the pre-built default tag."""
+        item = Item(name="Pen", quantity=1)
+
+        self.assertEqual(
+            html_renderer._DEFAULT_STYLE_TAG,
+            f"<style>{html_renderer._get_default_css()}</style>",
+        )
+        for html in (render_html(item), html_renderer.model_to_html(item)):
+            self.assertTrue(html.startswith(html_renderer._DEFAULT_STYLE_TAG))
+
+    def test_model_to_html_style_choices(self):
+        """Custom CSS replaces the default, and no CSS emits no <style> at all."""
+        item = Item(name="Pen", quantity=1)
+
+        custom_html = html_renderer.model_to_html(item, include_css=False, custom_css=".a{}")
+        bare_html = html_renderer.model_to_html(item, include_css=False)
+
+        self.assertTrue(custom_html.startswith("<style>.a{}</style><div"))
+        self.assertNotIn(html_renderer._DEFAULT_STYLE_TAG, custom_html)
+        self.assertNotIn("<style>", bare_html)
+
+
+class TestFormFieldTable(unittest.TestCase):
+    def test_inline_htmx_attributes(self):
+        """Inline mode adds the HTMX attributes to every input, full mode to none."""
+        html = render_html(Account(username="second", age=30), editable=True, htmx=True, htmx_mode="inline")
+        plain_html = render_html(Account(username="third", age=40), editable=True, htmx=True)
+
+        self.assertEqual(html.count(' hx-trigger="change" hx-post="/update-field"'), 2)
+        self.assertIn('value="second"', html)
+        self.assertNotIn('hx-post="/update-field"', plain_html)
+
+    def test_form_table_is_built_once_per_class(self):
+        """Form inputs and input attributes are resolved once per class."""
+        render_html(Account(username="first", age=20), editable=True)
+        table = html_renderer._FIELD_TABLE_CACHE[Account]
+
+        html = render_html(Account(username="second", age=30), editable=True)
+
+        self.assertIs(html_renderer._FIELD_TABLE_CACHE[Account], table)
+        names, input_factories, attr_strings, label_htmls = table
+        self.assertEqual(names, ("username", "age"))
+        self.assertEqual(
+            input_factories, (html_renderer._text_input, html_renderer._int_input)
+        )
+        self.assertTrue(attr_strings[0].startswith('id="username" name="username"'))
+        self.assertEqual(
+            label_htmls[1], '<div class="form-field"><label for="age">age</label>'
+        )
+        self.assertIn('value="second"', html)
+        self.assertIn('value="30"', html)
+
+    def test_optional_types_are_resolved_once(self):
+        """Optional fields get the input of their non-None type."""
+        for model_cls in (Profile, UnionProfile):
+            with self.subTest(model=model_cls.__name__):
+                html = render_html(model_cls(nickname="<b>"), editable=True)
+
+                self.assertIn('<input type="text" id="nickname"', html)
+                self.assertIn('value="&lt;b&gt;"', html)
+                self.assertIn('type="number" step="1" id="score" name="score" required value="3"', html)
+
+    def test_falsy_text_values_are_kept(self):
+        """Only None leaves a text input empty; zero is shown as a value."""
+        html = render_html(Counter(), editable=True)
+
+        self.assertIn('name="label" required value=""', html)
+        self.assertIn('name="count" required value="0"', html)
+
+    def test_optional_choices_use_their_dropdown(self):
+        """Optional enums and literals keep their dropdown once unwrapped."""
+        for model_cls in (Assignment, UnionAssignment):
+            with self.subTest(model=model_cls.__name__):
+                html = render_html(model_cls(status=Status.OPEN), editable=True)
+
+                self.assertEqual(html.count("<select "), 2)
+                self.assertIn('<option value="open" selected>open</option>', html)
+                self.assertIn('<option value="M" selected>M</option>', html)
+
+    def test_failed_form_falls_back_to_table(self):
+        """Fields written before a failing input are dropped from the fallback."""
+        meeting = Meeting.model_construct(topic="Planning", starts_at="tomorrow")
+
+        html = render_html(meeting, editable=True)
+
+        self.assertIn("<!-- Form generation failed:", html)
+        self.assertNotIn('<label for="topic">', html)
+        self.assertIn("<td class=\"field-value\">Planning</td>", html)
+        self.assertIn("<td class=\"field-value\">tomorrow</td>", html)
+
+    def test_enum_options_are_rendered_once(self):
+        """Enum dropdown options are pre-rendered and only the selection changes."""
+        render_html(Ticket(title="Bug", status=Status.OPEN), editable=True)
+
+        html = render_html(Ticket(title="Bug", status=Status.CLOSED), editable=True)
+
+        self.assertIn(
+            '<option value="open" >open</option>'
+            '<option value="closed" selected>closed</option>',
+            html,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()